@@ -1,13 +1,24 @@
 """Factory for creating platform adapters."""
 
+import functools
+import re
+
+from docscrape.adapters.generic import GenericAdapter
+from docscrape.adapters.livekit import LiveKitAdapter
+from docscrape.adapters.pipecat import PipecatAdapter
+from docscrape.adapters.retellai import RetellAIAdapter
 from docscrape.core.interfaces import PlatformAdapter
 
 
 class PlatformAdapterFactory:
     """Factory for creating platform-specific adapters."""
 
-    # Registry of known platforms (lazy-loaded to avoid circular imports)
-    _PLATFORMS: dict[str, type[PlatformAdapter]] | None = None
+    # Registry of known platforms
+    _PLATFORMS: dict[str, type[PlatformAdapter]] = {
+        "livekit": LiveKitAdapter,
+        "pipecat": PipecatAdapter,
+        "retellai": RetellAIAdapter,
+    }
 
     # URL patterns to auto-detect platform
     _URL_PATTERNS: dict[str, str] = {
@@ -19,20 +30,16 @@ class PlatformAdapterFactory:
         "retellai.com/docs": "retellai",
     }
 
+    # Union of all URL patterns, compiled lazily so one search replaces
+    # the per-call linear scan over _URL_PATTERNS.
+    _URL_PATTERN_RE: re.Pattern[str] | None = None
+
     @classmethod
-    def _load_platforms(cls) -> dict[str, type[PlatformAdapter]]:
-        """Lazy-load platform adapters to avoid circular imports."""
-        if cls._PLATFORMS is None:
-            from docscrape.adapters.livekit import LiveKitAdapter
-            from docscrape.adapters.pipecat import PipecatAdapter
-            from docscrape.adapters.retellai import RetellAIAdapter
-
-            cls._PLATFORMS = {
-                "livekit": LiveKitAdapter,
-                "pipecat": PipecatAdapter,
-                "retellai": RetellAIAdapter,
-            }
-        return cls._PLATFORMS
+    def _get_url_pattern_re(cls) -> re.Pattern[str]:
+        """Return the compiled URL-pattern union, rebuilding if invalidated."""
+        if cls._URL_PATTERN_RE is None:
+            cls._URL_PATTERN_RE = re.compile("|".join(map(re.escape, cls._URL_PATTERNS)))
+        return cls._URL_PATTERN_RE
 
     @classmethod
     def get_adapter(
@@ -42,6 +49,9 @@ class PlatformAdapterFactory:
     ) -> PlatformAdapter:
         """Get a platform adapter.
 
+        Adapters are stateless, so instances are cached and shared across
+        calls with the same arguments.
+
         Args:
             platform: Platform name (e.g., "livekit", "pipecat").
             url: URL to auto-detect platform from.
@@ -52,23 +62,26 @@ class PlatformAdapterFactory:
         Raises:
             ValueError: If neither platform nor url is provided.
         """
-        platforms = cls._load_platforms()
+        return _cached_get_adapter(platform.lower() if platform else None, url)
 
+    @classmethod
+    def _build_adapter(
+        cls,
+        platform: str | None,
+        url: str | None,
+    ) -> PlatformAdapter:
+        """Construct an adapter (uncached); see get_adapter."""
         # If platform is specified, use it
-        if platform:
-            platform_lower = platform.lower()
-            if platform_lower in platforms:
-                return platforms[platform_lower]()
+        if platform and platform in cls._PLATFORMS:
+            return cls._PLATFORMS[platform]()
 
         # Try to auto-detect from URL
         if url:
-            for pattern, platform_name in cls._URL_PATTERNS.items():
-                if pattern in url:
-                    return platforms[platform_name]()
+            match = cls._get_url_pattern_re().search(url)
+            if match:
+                return cls._PLATFORMS[cls._URL_PATTERNS[match.group(0)]]()
 
             # Fall back to generic adapter
-            from docscrape.adapters.generic import GenericAdapter
-
             return GenericAdapter(base_url=url)
 
         raise ValueError("Either platform or url must be provided")
@@ -76,7 +89,7 @@ class PlatformAdapterFactory:
     @classmethod
     def list_platforms(cls) -> list[str]:
         """List all known platforms."""
-        return list(cls._load_platforms().keys())
+        return _cached_list_platforms()
 
     @classmethod
     def register_platform(
@@ -92,9 +105,25 @@ class PlatformAdapterFactory:
             adapter_class: Adapter class.
             url_patterns: URL patterns for auto-detection.
         """
-        platforms = cls._load_platforms()
-        platforms[name.lower()] = adapter_class
+        cls._PLATFORMS[name.lower()] = adapter_class
 
         if url_patterns:
             for pattern in url_patterns:
                 cls._URL_PATTERNS[pattern] = name.lower()
+
+        # Invalidate caches that baked in the previous registry
+        cls._URL_PATTERN_RE = None
+        _cached_get_adapter.cache_clear()
+        _cached_list_platforms.cache_clear()
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_get_adapter(platform: str | None, url: str | None) -> PlatformAdapter:
+    """Cache adapter instances keyed by normalized arguments."""
+    return PlatformAdapterFactory._build_adapter(platform, url)
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_list_platforms() -> list[str]:
+    """Cache the platform listing until the registry changes."""
+    return list(PlatformAdapterFactory._PLATFORMS.keys())
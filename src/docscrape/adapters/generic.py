@@ -1,25 +1,131 @@
 """Generic adapter for documentation sites."""
 
 import re
+from collections.abc import Sequence
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import ClassVar
+from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from html_to_markdown import ConversionOptions
+from html_to_markdown import convert as html_to_md
 from markdownify import markdownify as md
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
 from docscrape.core.interfaces import DiscoveryStrategy, PlatformAdapter
 from docscrape.core.models import DocumentPage
 from docscrape.discovery.sitemap import SitemapDiscovery
 
+# Options for the Rust-backed html-to-markdown converter, built once.
+_MD_OPTIONS = ConversionOptions(heading_style="atx", extract_metadata=False)
+
+# Backend for the BeautifulSoup fallback parse; naming it once keeps both
+# call sites on the same C-based builder.
+_BS4_PARSER = "lxml"
+
+# Selectors that are plain tag names need no CSS matching at all.
+_TAG_NAME_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9]*$")
+
+# Extensions stripped from URL paths before appending .md.
+_EXT_STRIP_RE = re.compile(r"\.(?:html?|md)$", re.IGNORECASE)
+
+# Markdown cleanup patterns, compiled once instead of per page.
+_MULTI_BLANK_RE = re.compile(r"\n{3,}")
+_TRAILING_WS_RE = re.compile(r"[ \t]+(?=\n)")
+
+# Characters that make a skip pattern a real regex; anything else is a
+# literal substring. Hyphens are only special inside character classes.
+_REGEX_METACHARS = frozenset(".^$*+?{}[]|()\\")
+
+# Bare class names treated as code languages when no language-/lang- prefix
+# is present.
+_BARE_LANGUAGE_CLASSES = frozenset(
+    ["python", "javascript", "typescript", "bash", "shell", "json", "yaml"]
+)
+
+# Tags worth materializing in the BeautifulSoup fallback parse. Scripts,
+# styles, and chrome wrappers are never emitted, so we skip building DOM
+# objects that extract_content would immediately decompose. title/meta are
+# kept for title extraction.
+_BODY_STRAINER = SoupStrainer(
+    [
+        "article",
+        "main",
+        "section",
+        "div",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "p",
+        "pre",
+        "code",
+        "ul",
+        "ol",
+        "li",
+        "table",
+        "a",
+        "title",
+        "meta",
+    ]
+)
+
 
 class GenericAdapter(PlatformAdapter):
-    """Generic adapter that works with most documentation sites."""
+    """Generic adapter that works with most documentation sites.
+
+    Content extraction parses with selectolax (Lexbor); the BeautifulSoup
+    fallback uses the C-based ``lxml`` backend rather than ``html.parser``,
+    so ``lxml`` is a required dependency.
+    """
+
+    # Default selectors, shared across all instances (subclasses define
+    # their own class-level tuples and pass them to __init__).
+    CONTENT_SELECTORS: tuple[str, ...] = (
+        "article",
+        "main",
+        ".markdown-body",
+        ".content",
+        ".documentation",
+        ".docs-content",
+        "#content",
+        "#main-content",
+    )
+    SKIP_SELECTORS: tuple[str, ...] = (
+        "nav",
+        "header",
+        "footer",
+        ".sidebar",
+        ".toc",
+        ".table-of-contents",
+        ".navigation",
+        ".breadcrumb",
+        ".edit-page",
+        ".feedback",
+        "script",
+        "style",
+    )
+
+    # Ordered (regex fragment, priority) pairs for get_url_priority and
+    # regex fragments marking skippable URLs. Both are compiled lazily
+    # per class; the memoized predicates below keep the per-URL cost to
+    # one dict lookup after the first sighting.
+    PRIORITY_TABLE: tuple[tuple[str, int], ...] = ()
+    PRIORITY_DEFAULT: int = 0
+    SKIP_URL_PATTERNS: tuple[str, ...] = ()
+
+    # Lazily-built matcher caches, one per subclass (created on first
+    # use via the classmethods below; declared here for the type gate).
+    _PRIORITY_RULES: ClassVar[tuple[tuple[re.Pattern[str], int], ...]]
+    _SKIP_URL_RE: ClassVar[re.Pattern[str] | None]
+    _SKIP_URL_FIXED: ClassVar[tuple[str, ...] | None]
 
     def __init__(
         self,
         base_url: str,
-        content_selectors: list[str] | None = None,
-        skip_selectors: list[str] | None = None,
+        content_selectors: Sequence[str] | None = None,
+        skip_selectors: Sequence[str] | None = None,
     ) -> None:
         """Initialize the adapter.
 
@@ -29,30 +135,32 @@ class GenericAdapter(PlatformAdapter):
             skip_selectors: CSS selectors for elements to remove before extraction.
         """
         self._base_url = base_url.rstrip("/")
-        self._content_selectors = content_selectors or [
-            "article",
-            "main",
-            ".markdown-body",
-            ".content",
-            ".documentation",
-            ".docs-content",
-            "#content",
-            "#main-content",
-        ]
-        self._skip_selectors = skip_selectors or [
-            "nav",
-            "header",
-            "footer",
-            ".sidebar",
-            ".toc",
-            ".table-of-contents",
-            ".navigation",
-            ".breadcrumb",
-            ".edit-page",
-            ".feedback",
-            "script",
-            "style",
-        ]
+        self._content_selectors = (
+            tuple(content_selectors) if content_selectors else self.CONTENT_SELECTORS
+        )
+        self._skip_selectors = tuple(skip_selectors) if skip_selectors else self.SKIP_SELECTORS
+        # Pre-compile selectors once for the BeautifulSoup fallback path;
+        # soupsieve otherwise re-parses each selector string on every page.
+        # One union selector strips every skip-listed element in a single
+        # DOM traversal instead of one walk per selector.
+        self._skip_selector_combined = ", ".join(self._skip_selectors)
+        self._skip_combined_compiled = soupsieve.compile(self._skip_selector_combined)
+        # Two-tier content lookup: the preferred selector alone (common
+        # case), then one combined query instead of a DOM walk per selector.
+        # The combined match is document-order rather than preference-order,
+        # which is acceptable once the preferred selector has missed.
+        first = self._content_selectors[0]
+        self._content_first: str | soupsieve.SoupSieve = (
+            first if _TAG_NAME_RE.match(first) else soupsieve.compile(first)
+        )
+        self._content_selector_combined = ", ".join(self._content_selectors)
+        self._content_combined_compiled = soupsieve.compile(self._content_selector_combined)
+        # Per-URL memos: discovery consults both predicates for every
+        # yielded URL, including repeats from the fallback strategy, so
+        # each unique URL pays its regex search once. Plain dicts beat
+        # lru_cache here (no wrapper call, no hashed-key bookkeeping).
+        self._skip_cache: dict[str, bool] = {}
+        self._priority_cache: dict[str, int] = {}
 
     @property
     def name(self) -> str:
@@ -66,9 +174,73 @@ class GenericAdapter(PlatformAdapter):
         """Return sitemap discovery as the default strategy."""
         return SitemapDiscovery()
 
+    @classmethod
+    def _get_priority_rules(cls) -> tuple[tuple[re.Pattern[str], int], ...]:
+        """Compile the priority patterns once per class, in table order.
+
+        Kept as one compiled pattern per entry rather than a union regex:
+        a union returns the leftmost match in the URL, which silently
+        reorders overlapping rules (e.g. /examples/quickstart). The
+        first-table-entry-wins contract must hold.
+        """
+        if "_PRIORITY_RULES" not in cls.__dict__:
+            cls._PRIORITY_RULES = tuple((re.compile(p), v) for p, v in cls.PRIORITY_TABLE)
+        return cls._PRIORITY_RULES
+
+    @classmethod
+    def _get_skip_matcher(cls) -> re.Pattern[str] | None:
+        """Compile the skip-URL union regex once per class.
+
+        Pattern sets made up entirely of literal substrings skip the regex
+        engine: _SKIP_URL_FIXED keeps the raw strings for C-level ``in``
+        searches and the matcher stays None.
+        """
+        if "_SKIP_URL_RE" not in cls.__dict__:
+            patterns = cls.SKIP_URL_PATTERNS
+            if patterns and all(_REGEX_METACHARS.isdisjoint(p) for p in patterns):
+                cls._SKIP_URL_FIXED = patterns
+                cls._SKIP_URL_RE = None
+            else:
+                cls._SKIP_URL_FIXED = None
+                cls._SKIP_URL_RE = re.compile("|".join(patterns)) if patterns else None
+        return cls._SKIP_URL_RE
+
+    def should_skip(self, url: str) -> bool:
+        """Check if URL should be skipped, via one memoized search."""
+        cached = self._skip_cache.get(url)
+        if cached is None:
+            matcher = self._get_skip_matcher()
+            if self._SKIP_URL_FIXED is not None:
+                cached = any(s in url for s in self._SKIP_URL_FIXED)
+            else:
+                cached = bool(matcher.search(url)) if matcher else False
+            self._skip_cache[url] = cached
+        return cached
+
+    def get_url_priority(self, url: str) -> int:
+        """Get priority for URL ordering; first matching table entry wins.
+
+        The per-URL memo means the rule chain runs once per unique URL.
+        """
+        try:
+            return self._priority_cache[url]
+        except KeyError:
+            pass
+        priority = self.PRIORITY_DEFAULT
+        for pattern, value in self._get_priority_rules():
+            if pattern.search(url):
+                priority = value
+                break
+        self._priority_cache[url] = priority
+        return priority
+
     def extract_content(self, html: str, url: str) -> DocumentPage:
         """Extract content from HTML.
 
+        Parses with selectolax (Lexbor), whose CSS engine runs in C and is
+        an order of magnitude faster than BeautifulSoup on real pages.
+        Falls back to BeautifulSoup if Lexbor fails on malformed input.
+
         Args:
             html: Raw HTML content.
             url: Source URL.
@@ -76,25 +248,81 @@ class GenericAdapter(PlatformAdapter):
         Returns:
             Extracted DocumentPage.
         """
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Remove unwanted elements
-        for selector in self._skip_selectors:
-            for elem in soup.select(selector):
-                elem.decompose()
-
-        # Find content area
-        content_elem = None
-        for selector in self._content_selectors:
-            content_elem = soup.select_one(selector)
-            if content_elem:
-                break
+        try:
+            return self._extract_content_lexbor(html, url)
+        except Exception:
+            return self._extract_content_bs4(html, url)
+
+    def _extract_content_lexbor(self, html: str, url: str) -> DocumentPage:
+        """Extract content using the selectolax Lexbor parser (fast path)."""
+        tree = LexborHTMLParser(html)
+
+        # Remove unwanted elements in one traversal
+        for elem in tree.css(self._skip_selector_combined):
+            elem.decompose()
+
+        # Find content area: preferred selector first, then one combined query
+        content_elem = tree.css_first(self._content_selectors[0])
+        if content_elem is None:
+            content_elem = tree.css_first(self._content_selector_combined)
+
+        if content_elem is None:
+            content_elem = tree.body or tree.root
+
+        # Extract links before converting to markdown
+        links = self._extract_links(content_elem, url) if content_elem is not None else []
+
+        # Normalize bare language classes so the Rust converter picks them up
+        if content_elem is not None:
+            self._normalize_code_languages(content_elem)
+
+        content_html = (content_elem.html or "") if content_elem is not None else ""
+
+        # Convert to markdown (Rust-backed; markdownify as fallback)
+        try:
+            markdown = html_to_md(content_html, _MD_OPTIONS).content
+        except Exception:
+            markdown = md(
+                content_html,
+                heading_style="atx",
+                code_language_callback=self._detect_language,
+            )
+
+        # Clean up markdown
+        markdown = self._clean_markdown(markdown)
+
+        # Extract title (pass markdown for fallback extraction)
+        title = self._extract_title(tree, markdown)
+
+        return DocumentPage(
+            url=url,
+            title=title or "Untitled",
+            content_markdown=markdown,
+            content_html=content_html,
+            links=links,
+        )
+
+    def _extract_content_bs4(self, html: str, url: str) -> DocumentPage:
+        """Extract content using BeautifulSoup (fallback path)."""
+        # Strained parse: only materialize content-bearing tags, cutting
+        # allocations for chrome we would decompose anyway.
+        soup = BeautifulSoup(html, _BS4_PARSER, parse_only=_BODY_STRAINER)
+
+        self._strip_skip_elements(soup)
+        content_elem = self._find_content_elem(soup)
+
+        if not content_elem:
+            # The strainer may have dropped the wrapper the selectors need;
+            # re-parse the full document before giving up on them.
+            soup = BeautifulSoup(html, _BS4_PARSER)
+            self._strip_skip_elements(soup)
+            content_elem = self._find_content_elem(soup)
 
         if not content_elem:
             content_elem = soup.body or soup
 
         # Extract links before converting to markdown
-        links = self._extract_links(content_elem, url)
+        links = self._extract_links_bs4(content_elem, url)
 
         # Convert to markdown
         markdown = md(
@@ -107,7 +335,7 @@ class GenericAdapter(PlatformAdapter):
         markdown = self._clean_markdown(markdown)
 
         # Extract title (pass markdown for fallback extraction)
-        title = self._extract_title(soup, markdown)
+        title = self._extract_title_bs4(soup, markdown)
 
         return DocumentPage(
             url=url,
@@ -117,6 +345,24 @@ class GenericAdapter(PlatformAdapter):
             links=links,
         )
 
+    def _strip_skip_elements(self, soup: BeautifulSoup) -> None:
+        """Remove skip-listed elements in one pass (fallback path)."""
+        for elem in self._skip_combined_compiled.select(soup):
+            elem.decompose()
+
+    def _find_content_elem(self, soup: BeautifulSoup) -> BeautifulSoup | None:
+        """Find the content element (fallback path).
+
+        Tries the preferred selector alone, then the combined union query.
+        """
+        if isinstance(self._content_first, str):
+            content_elem = soup.find(self._content_first)
+        else:
+            content_elem = self._content_first.select_one(soup)
+        if content_elem:
+            return content_elem
+        return self._content_combined_compiled.select_one(soup)
+
     def url_to_filepath(self, url: str, output_dir: Path) -> Path:
         """Convert URL to filepath.
 
@@ -127,24 +373,45 @@ class GenericAdapter(PlatformAdapter):
         Returns:
             Local filepath.
         """
-        parsed = urlparse(url)
-        path = parsed.path.strip("/")
+        path = urlparse(url).path.strip("/") or "index"
+        return output_dir / (_EXT_STRIP_RE.sub("", path) + ".md")
 
-        if not path:
-            path = "index"
+    def _extract_title(self, tree: LexborHTMLParser, markdown: str | None = None) -> str | None:
+        """Extract page title from a Lexbor tree."""
+        # Try meta title
+        meta_title = tree.css_first('meta[property="og:title"]')
+        if meta_title is not None:
+            content = meta_title.attributes.get("content")
+            if content:
+                return content
 
-        # Remove common extensions
-        for ext in [".html", ".htm", ".md"]:
-            if path.endswith(ext):
-                path = path[: -len(ext)]
+        # Try title tag
+        title_elem = tree.css_first("title")
+        if title_elem is not None:
+            title = title_elem.text().strip()
+            if title:
+                # Remove common suffixes
+                for suffix in [" | Docs", " - Documentation", " | Documentation"]:
+                    if title.endswith(suffix):
+                        title = title[: -len(suffix)]
+                return title
 
-        # Add .md extension
-        path = path + ".md"
+        # Try h1
+        h1 = tree.css_first("h1")
+        if h1 is not None:
+            return h1.text(strip=True)
 
-        return output_dir / path
+        # Try extracting from markdown content (for raw .md files)
+        if markdown:
+            # Look for # Title at the start
+            h1_match = re.search(r"^#\s+(.+)$", markdown, re.MULTILINE)
+            if h1_match:
+                return h1_match.group(1).strip()
 
-    def _extract_title(self, soup: BeautifulSoup, markdown: str | None = None) -> str | None:
-        """Extract page title."""
+        return None
+
+    def _extract_title_bs4(self, soup: BeautifulSoup, markdown: str | None = None) -> str | None:
+        """Extract page title (fallback path)."""
         # Try meta title
         meta_title = soup.find("meta", property="og:title")
         if meta_title and meta_title.get("content"):
@@ -173,10 +440,40 @@ class GenericAdapter(PlatformAdapter):
 
         return None
 
-    def _extract_links(self, content: BeautifulSoup, current_url: str) -> list[str]:
-        """Extract internal links from content."""
-        links = []
-        base_domain = urlparse(current_url).netloc
+    def _extract_links(self, content: LexborNode, current_url: str) -> set[str]:
+        """Extract internal links from a Lexbor content node."""
+        links: set[str] = set()
+        # Parse the current URL once; root-relative hrefs (the common case
+        # in docs sidebars) resolve with a concat instead of a urljoin call.
+        parsed_current = urlparse(current_url)
+        base_domain = parsed_current.netloc
+        scheme_netloc = f"{parsed_current.scheme}://{base_domain}"
+
+        for a in content.css("a[href]"):
+            href = a.attributes.get("href") or ""
+
+            # Skip anchors and non-http links
+            if not href or href.startswith(("#", "javascript:", "mailto:")):
+                continue
+
+            if href.startswith("/") and not href.startswith("//"):
+                href = scheme_netloc + href
+            else:
+                # urljoin handles absolute and relative hrefs
+                href = urljoin(current_url, href)
+
+            # Only include internal links
+            if urlparse(href).netloc == base_domain:
+                links.add(href)
+
+        return links
+
+    def _extract_links_bs4(self, content: BeautifulSoup, current_url: str) -> set[str]:
+        """Extract internal links from content (fallback path)."""
+        links: set[str] = set()
+        parsed_current = urlparse(current_url)
+        base_domain = parsed_current.netloc
+        scheme_netloc = f"{parsed_current.scheme}://{base_domain}"
 
         for a in content.find_all("a", href=True):
             href = a["href"]
@@ -185,55 +482,60 @@ class GenericAdapter(PlatformAdapter):
             if href.startswith(("#", "javascript:", "mailto:")):
                 continue
 
-            # Resolve relative URLs
-            if href.startswith("/"):
-                parsed = urlparse(current_url)
-                href = f"{parsed.scheme}://{parsed.netloc}{href}"
-            elif not href.startswith("http"):
-                from urllib.parse import urljoin
-
+            if href.startswith("/") and not href.startswith("//"):
+                href = scheme_netloc + href
+            else:
+                # urljoin handles absolute and relative hrefs
                 href = urljoin(current_url, href)
 
             # Only include internal links
             if urlparse(href).netloc == base_domain:
-                links.append(href)
+                links.add(href)
 
         return links
 
+    def _normalize_code_languages(self, content: LexborNode) -> None:
+        """Rewrite bare language classes to the ``language-*`` form.
+
+        html-to-markdown natively recognizes ``language-*`` and ``lang-*``
+        classes on code blocks, but not bare names like ``class="python"``.
+        """
+        for code in content.css("pre code[class]"):
+            classes = (code.attributes.get("class") or "").split()
+            if any(cls.startswith(("language-", "lang-")) for cls in classes):
+                continue
+            for cls in classes:
+                if cls in _BARE_LANGUAGE_CLASSES:
+                    code.attrs["class"] = f"language-{cls}"
+                    break
+
     def _detect_language(self, elem: BeautifulSoup) -> str | None:
-        """Detect code language from element classes."""
+        """Detect code language from element classes.
+
+        Called back by markdownify with BeautifulSoup elements, so this
+        stays on the bs4 element API even though parsing uses Lexbor.
+        """
         if not elem:
             return None
 
-        classes = elem.get("class", [])
-        for cls in classes:
-            if cls.startswith("language-"):
+        # Slice compares beat startswith for short fixed prefixes, and this
+        # runs once per <code> block in the markdownify fallback.
+        for cls in elem.get("class", []):
+            if cls[:9] == "language-":
                 return cls[9:]
-            if cls.startswith("lang-"):
+            if cls[:5] == "lang-":
                 return cls[5:]
-            if cls in [
-                "python",
-                "javascript",
-                "typescript",
-                "bash",
-                "shell",
-                "json",
-                "yaml",
-            ]:
+            if cls in _BARE_LANGUAGE_CLASSES:
                 return cls
 
         return None
 
     def _clean_markdown(self, markdown: str) -> str:
         """Clean up converted markdown."""
-        # Remove excessive blank lines
-        markdown = re.sub(r"\n{3,}", "\n\n", markdown)
-
-        # Remove leading/trailing whitespace from lines
-        lines = [line.rstrip() for line in markdown.split("\n")]
-        markdown = "\n".join(lines)
+        # Remove trailing whitespace from lines, then collapse excessive
+        # blank lines; two regex passes instead of a split/join per page.
+        markdown = _TRAILING_WS_RE.sub("", markdown)
+        markdown = _MULTI_BLANK_RE.sub("\n\n", markdown)
 
         # Remove leading/trailing blank lines
-        markdown = markdown.strip()
-
-        return markdown
+        return markdown.strip()
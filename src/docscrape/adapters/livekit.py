@@ -13,30 +13,45 @@ class LiveKitAdapter(GenericAdapter):
 
     BASE_URL = "https://docs.livekit.io"
 
+    CONTENT_SELECTORS = (
+        "article",
+        ".prose",
+        "main",
+    )
+    SKIP_SELECTORS = (
+        "nav",
+        "header",
+        "footer",
+        ".sidebar",
+        ".toc",
+        ".table-of-contents",
+        ".navigation",
+        ".breadcrumb",
+        ".edit-page",
+        ".feedback",
+        ".copy-button",
+        "script",
+        "style",
+    )
+
+    # Skip auto-generated API reference pages and the changelog
+    SKIP_URL_PATTERNS = ("/api-reference/", "/changelog")
+
+    # Prioritize main topics
+    PRIORITY_TABLE = (
+        ("/agents/", 100),
+        ("/realtime/", 90),
+        ("/guides/", 80),
+        ("/quickstarts/", 70),
+    )
+    PRIORITY_DEFAULT = 50
+
     def __init__(self) -> None:
         """Initialize the LiveKit adapter."""
         super().__init__(
             base_url=self.BASE_URL,
-            content_selectors=[
-                "article",
-                ".prose",
-                "main",
-            ],
-            skip_selectors=[
-                "nav",
-                "header",
-                "footer",
-                ".sidebar",
-                ".toc",
-                ".table-of-contents",
-                ".navigation",
-                ".breadcrumb",
-                ".edit-page",
-                ".feedback",
-                ".copy-button",
-                "script",
-                "style",
-            ],
+            content_selectors=self.CONTENT_SELECTORS,
+            skip_selectors=self.SKIP_SELECTORS,
         )
 
     @property
@@ -52,35 +67,5 @@ class LiveKitAdapter(GenericAdapter):
 
         LiveKit URLs often have .md extension already in llms.txt.
         """
-        parsed = urlparse(url)
-        path = parsed.path.strip("/")
-
-        if not path:
-            path = "index.md"
-        elif not path.endswith(".md"):
-            path = path + ".md"
-
-        return output_dir / path
-
-    def should_skip(self, url: str) -> bool:
-        """Check if URL should be skipped."""
-        # Skip API reference pages (usually auto-generated)
-        if "/api-reference/" in url:
-            return True
-
-        # Skip changelog
-        return "/changelog" in url
-
-    def get_url_priority(self, url: str) -> int:
-        """Get priority for URL ordering."""
-        # Prioritize main topics
-        if "/agents/" in url:
-            return 100
-        if "/realtime/" in url:
-            return 90
-        if "/guides/" in url:
-            return 80
-        if "/quickstarts/" in url:
-            return 70
-
-        return 50
+        path = urlparse(url).path.strip("/") or "index.md"
+        return output_dir / (path if path.endswith(".md") else path + ".md")
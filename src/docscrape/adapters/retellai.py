@@ -1,8 +1,5 @@
 """Adapter for RetellAI documentation."""
 
-from pathlib import Path
-from urllib.parse import urlparse
-
 from docscrape.adapters.generic import GenericAdapter
 from docscrape.core.interfaces import DiscoveryStrategy
 from docscrape.discovery.recursive import RecursiveCrawlDiscovery
@@ -14,33 +11,51 @@ class RetellAIAdapter(GenericAdapter):
 
     BASE_URL = "https://docs.retellai.com"
 
+    CONTENT_SELECTORS = (
+        "article",
+        ".markdown-body",
+        "main",
+        ".prose",
+        ".content",
+        "#content",
+    )
+    SKIP_SELECTORS = (
+        "nav",
+        "header",
+        "footer",
+        ".sidebar",
+        ".toc",
+        ".table-of-contents",
+        ".navigation",
+        ".breadcrumb",
+        ".edit-page",
+        ".feedback",
+        ".copy-button",
+        "script",
+        "style",
+    )
+
+    # Skip API reference pages (usually auto-generated)
+    SKIP_URL_PATTERNS = ("/api-reference/",)
+
+    # Prioritize conversation flow documentation (main interest)
+    PRIORITY_TABLE = (
+        (r"(?i:conversation-flow)", 100),
+        ("/quickstart", 95),
+        ("/getting-started", 90),
+        ("/concepts", 85),
+        ("/examples", 80),
+        ("/guides", 75),
+        ("/custom-llm", 70),
+    )
+    PRIORITY_DEFAULT = 50
+
     def __init__(self) -> None:
         """Initialize the RetellAI adapter."""
         super().__init__(
             base_url=self.BASE_URL,
-            content_selectors=[
-                "article",
-                ".markdown-body",
-                "main",
-                ".prose",
-                ".content",
-                "#content",
-            ],
-            skip_selectors=[
-                "nav",
-                "header",
-                "footer",
-                ".sidebar",
-                ".toc",
-                ".table-of-contents",
-                ".navigation",
-                ".breadcrumb",
-                ".edit-page",
-                ".feedback",
-                ".copy-button",
-                "script",
-                "style",
-            ],
+            content_selectors=self.CONTENT_SELECTORS,
+            skip_selectors=self.SKIP_SELECTORS,
         )
 
     @property
@@ -57,45 +72,3 @@ class RetellAIAdapter(GenericAdapter):
             max_depth=4,
             content_selector="main",
         )
-
-    def url_to_filepath(self, url: str, output_dir: Path) -> Path:
-        """Convert URL to filepath."""
-        parsed = urlparse(url)
-        path = parsed.path.strip("/")
-
-        if not path:
-            path = "index"
-
-        # Remove common extensions
-        for ext in [".html", ".htm", ".md"]:
-            if path.endswith(ext):
-                path = path[: -len(ext)]
-
-        path = path + ".md"
-
-        return output_dir / path
-
-    def should_skip(self, url: str) -> bool:
-        """Check if URL should be skipped."""
-        # Skip API reference pages (usually auto-generated)
-        return "/api-reference/" in url
-
-    def get_url_priority(self, url: str) -> int:
-        """Get priority for URL ordering."""
-        # Prioritize conversation flow documentation (main interest)
-        if "conversation-flow" in url.lower():
-            return 100
-        if "/quickstart" in url:
-            return 95
-        if "/getting-started" in url:
-            return 90
-        if "/concepts" in url:
-            return 85
-        if "/examples" in url:
-            return 80
-        if "/guides" in url:
-            return 75
-        if "/custom-llm" in url:
-            return 70
-
-        return 50
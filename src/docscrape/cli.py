@@ -2,15 +2,15 @@
 
 import asyncio
 import re
-import sys
 from pathlib import Path
 from typing import Annotated
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from typer.core import TyperGroup
 
 from docscrape import __version__
 from docscrape.adapters.factory import PlatformAdapterFactory
@@ -20,6 +20,10 @@ from docscrape.storage.filesystem import FilesystemStorage
 
 console = Console()
 
+# Compiled once: subdomain prefixes to drop and the leading domain name.
+_DOMAIN_PREFIX_RE = re.compile(r"^(?:docs|www|developer|developers)\.")
+_DOMAIN_NAME_RE = re.compile(r"^([a-zA-Z0-9-]+)")
+
 
 def version_callback(value: bool) -> None:
     """Print version and exit."""
@@ -36,16 +40,11 @@ def _derive_output_from_url(url: str) -> Path:
         https://docs.livekit.io/agents -> ./livekit/
         https://example.com/docs -> ./example/
     """
-    parsed = urlparse(url)
-    domain = parsed.netloc
-
-    # Remove common prefixes
-    for prefix in ["docs.", "www.", "developer.", "developers."]:
-        if domain.startswith(prefix):
-            domain = domain[len(prefix) :]
+    # urlsplit skips the params-splitting step urlparse does per path segment.
+    domain = _DOMAIN_PREFIX_RE.sub("", urlsplit(url).netloc)
 
     # Extract the main domain name (before .com, .io, .ai, etc.)
-    match = re.match(r"^([a-zA-Z0-9-]+)", domain)
+    match = _DOMAIN_NAME_RE.match(domain)
     name = match.group(1).lower() if match else "docs"
 
     return Path(f"./{name}/")
@@ -172,8 +171,28 @@ def _list_platforms() -> None:
     )
 
 
+class _DefaultCommandGroup(TyperGroup):
+    """Command group that routes URL-like first arguments to ``scrape``.
+
+    Allows both ``docscrape URL`` and ``docscrape scrape URL`` without
+    rewriting sys.argv before parsing. Only arguments that look like a
+    URL are rerouted, so a typo'd command name still fails with the
+    usual "No such command" error instead of being scraped.
+    """
+
+    def resolve_command(self, ctx, args):  # type: ignore[no-untyped-def]
+        if args and args[0] not in self.commands and self._looks_like_url(args[0]):
+            args = ["scrape", *args]
+        return super().resolve_command(ctx, args)
+
+    @staticmethod
+    def _looks_like_url(arg: str) -> bool:
+        return arg.startswith(("http://", "https://")) or "." in arg
+
+
 app = typer.Typer(
     name="docscrape",
+    cls=_DefaultCommandGroup,
     help="Scrape any documentation site to Markdown in seconds.",
     add_completion=False,
     rich_markup_mode="rich",
@@ -269,25 +288,15 @@ def platforms() -> None:
     _list_platforms()
 
 
-# Create a simpler CLI for direct URL usage
 def main() -> None:
-    """Main entry point with smart argument handling.
+    """Main entry point.
 
     Allows both:
         docscrape https://docs.example.com
         docscrape scrape https://docs.example.com
-    """
-    # Check if first arg looks like a URL (not a command)
-    if len(sys.argv) > 1:
-        first_arg = sys.argv[1]
-        # If it looks like a URL or starts with http, insert 'scrape' command
-        if (
-            first_arg.startswith(("http://", "https://"))
-            or "." in first_arg
-            and first_arg not in ("platforms", "scrape", "--help", "-h", "--version", "-V")
-        ):
-            sys.argv.insert(1, "scrape")
 
+    Routing happens inside the parser via _DefaultCommandGroup.
+    """
     app()
 
 
@@ -0,0 +1,74 @@
+"""Content fingerprinting for near-duplicate page detection."""
+
+import hashlib
+from collections.abc import Iterable
+
+_HASH_BITS = 64
+_BANDS = 4
+_BAND_BITS = _HASH_BITS // _BANDS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+
+
+def simhash(tokens: Iterable[str]) -> int:
+    """Compute a 64-bit SimHash fingerprint over a token stream.
+
+    Unlike an exact content hash, nearby inputs produce nearby outputs:
+    two pages that differ only in a version string or timestamp land
+    within a few bits of each other, so near-duplicates can be detected
+    with a Hamming-distance check instead of a byte-for-byte diff.
+    """
+    weights = [0] * _HASH_BITS
+    for token in tokens:
+        digest = hashlib.blake2b(token.encode(), digest_size=8).digest()
+        token_hash = int.from_bytes(digest, "little")
+        for bit in range(_HASH_BITS):
+            weights[bit] += 1 if (token_hash >> bit) & 1 else -1
+
+    value = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            value |= 1 << bit
+    return value
+
+
+class SimHashIndex:
+    """Index of SimHash values supporting small-radius lookups.
+
+    A linear scan over all stored hashes is O(N) per query. Splitting
+    each 64-bit hash into four 16-bit bands means any pair within
+    Hamming distance 3 must share at least one band verbatim
+    (pigeonhole), so candidates come from four dict lookups and only
+    those few get the popcount check.
+    """
+
+    def __init__(self, max_distance: int = 3) -> None:
+        """Initialize the index.
+
+        Args:
+            max_distance: Maximum Hamming distance treated as a match.
+                Must be < the number of bands (4) for the banding
+                guarantee to hold.
+        """
+        self._max_distance = max_distance
+        self._buckets: list[dict[int, list[int]]] = [{} for _ in range(_BANDS)]
+
+    @staticmethod
+    def _bands(value: int) -> list[int]:
+        return [(value >> (i * _BAND_BITS)) & _BAND_MASK for i in range(_BANDS)]
+
+    def add(self, value: int) -> None:
+        """Add a hash to the index."""
+        for i, band in enumerate(self._bands(value)):
+            self._buckets[i].setdefault(band, []).append(value)
+
+    def find_near(self, value: int) -> int | None:
+        """Return a stored hash within max_distance of value, or None."""
+        checked: set[int] = set()
+        for i, band in enumerate(self._bands(value)):
+            for candidate in self._buckets[i].get(band, ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                if (candidate ^ value).bit_count() <= self._max_distance:
+                    return candidate
+        return None
@@ -1,8 +1,15 @@
 """Abstract interfaces for docscrape."""
 
+import asyncio
+import os
+import re
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
+
+import httpx
 
 from docscrape.core.models import (
     DiscoveredUrl,
@@ -11,10 +18,69 @@ from docscrape.core.models import (
     ScrapeManifest,
 )
 
+# Shared process pool for CPU-bound content extraction, created on first use.
+_EXECUTOR: ProcessPoolExecutor | None = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Lazily create the shared extraction process pool."""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _EXECUTOR
+
+
+def _extract_in_worker(adapter: "PlatformAdapter", html: str, url: str) -> DocumentPage:
+    """Run extract_content in a worker process (module-level for pickling)."""
+    return adapter.extract_content(html, url)
+
 
 class DiscoveryStrategy(ABC):
     """Abstract base class for URL discovery strategies."""
 
+    #: Shared HTTP client injected by the caller (e.g. the crawler) so
+    #: discovery reuses pooled keepalive connections instead of paying a
+    #: fresh TCP+TLS handshake per strategy. When None, strategies create
+    #: a short-lived client of their own.
+    client: httpx.AsyncClient | None = None
+
+    #: Compiled include/exclude filters, set by _compile_url_filters().
+    #: Patterns with no regex metacharacters become plain substring
+    #: checks; the rest are fused into one union regex.
+    _include_literals: tuple[str, ...] = ()
+    _exclude_literals: tuple[str, ...] = ()
+    _include_re: re.Pattern[str] | None = None
+    _exclude_re: re.Pattern[str] | None = None
+
+    @staticmethod
+    def _split_patterns(patterns: list[str]) -> tuple[tuple[str, ...], re.Pattern[str] | None]:
+        """Partition patterns into literal substrings and a regex union."""
+        literals = tuple(p for p in patterns if re.escape(p) == p)
+        regexes = [p for p in patterns if re.escape(p) != p]
+        union = re.compile("|".join(f"(?:{p})" for p in regexes)) if regexes else None
+        return literals, union
+
+    def _compile_url_filters(self, config: ScrapeConfig) -> None:
+        """Precompile the config's include/exclude patterns.
+
+        Each URL is then filtered with C-level substring checks plus at
+        most one regex search per direction, instead of one ``re.search``
+        call per pattern.
+        """
+        self._include_literals, self._include_re = self._split_patterns(config.include_patterns)
+        self._exclude_literals, self._exclude_re = self._split_patterns(config.exclude_patterns)
+
+    def _url_passes_filters(self, url: str) -> bool:
+        """Check a URL against the precompiled include/exclude filters."""
+        if (self._include_literals or self._include_re is not None) and not (
+            any(lit in url for lit in self._include_literals)
+            or (self._include_re is not None and self._include_re.search(url) is not None)
+        ):
+            return False
+        if any(lit in url for lit in self._exclude_literals):
+            return False
+        return self._exclude_re is None or self._exclude_re.search(url) is None
+
     @abstractmethod
     async def discover(self, config: ScrapeConfig) -> AsyncIterator[DiscoveredUrl]:
         """Discover URLs to scrape.
@@ -67,6 +133,25 @@ class PlatformAdapter(ABC):
         """
         ...
 
+    async def extract_content_async(self, html: str, url: str) -> DocumentPage:
+        """Extract content on a worker process.
+
+        extract_content is pure CPU (HTML parse + markdown conversion) and
+        holds the GIL, so running it inline stalls the event loop. The
+        default implementation ships the adapter — a cheap, picklable
+        config object — to a shared process pool so extraction runs on
+        other cores while crawling I/O continues.
+
+        Args:
+            html: Raw HTML content.
+            url: Source URL.
+
+        Returns:
+            Extracted DocumentPage with markdown content.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), _extract_in_worker, self, html, url)
+
     @abstractmethod
     def url_to_filepath(self, url: str, output_dir: Path) -> Path:
         """Convert a URL to a local filepath.
@@ -138,6 +223,33 @@ class StorageBackend(ABC):
         """
         ...
 
+    @abstractmethod
+    async def append_page(self, entry: dict[str, Any], output_dir: Path) -> None:
+        """Append one page record to the incremental page log.
+
+        Called per completed page so checkpointing costs O(1) instead of
+        rewriting the whole manifest; the full manifest is saved once at
+        the end of the crawl.
+
+        Args:
+            entry: Manifest page entry for a single page.
+            output_dir: Target directory.
+        """
+        ...
+
+    async def finalize(self, manifest: ScrapeManifest, output_dir: Path) -> None:
+        """Flush final state at the end of a crawl.
+
+        Backends may defer expensive derived outputs (indexes, reports)
+        to this hook instead of rebuilding them on every checkpoint. The
+        default just saves the manifest.
+
+        Args:
+            manifest: Completed manifest.
+            output_dir: Target directory.
+        """
+        await self.save_manifest(manifest, output_dir)
+
     @abstractmethod
     async def page_exists(self, filepath: Path) -> bool:
         """Check if a page already exists.
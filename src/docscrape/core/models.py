@@ -1,14 +1,30 @@
 """Data models for docscrape."""
 
+import hashlib
+import sys
+from collections.abc import Iterator
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
 
-class ScrapeStatus(Enum):
-    """Status of a scrape operation."""
+def _utcnow() -> datetime:
+    """Timezone-aware UTC timestamp factory.
+
+    datetime.utcnow() is deprecated from 3.12; a module-level factory
+    also keeps the default_factory a plain function reference instead of
+    a bound-method lookup per instantiation.
+    """
+    return datetime.now(timezone.utc)
+
+
+class ScrapeStatus(str, Enum):
+    """Status of a scrape operation.
+
+    The str mixin keeps comparisons against raw manifest values cheap.
+    """
 
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
@@ -17,7 +33,7 @@ class ScrapeStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapeConfig:
     """Configuration for a scrape operation."""
 
@@ -28,6 +44,7 @@ class ScrapeConfig:
     request_delay: float = 0.5
     timeout: float = 30.0
     max_retries: int = 3
+    concurrency: int = 16  # Max in-flight requests
     include_patterns: list[str] = field(default_factory=list)
     exclude_patterns: list[str] = field(default_factory=list)
     resume: bool = False
@@ -35,7 +52,7 @@ class ScrapeConfig:
     quiet: bool = False  # Suppress progress bar
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveredUrl:
     """A URL discovered during the discovery phase."""
 
@@ -43,9 +60,16 @@ class DiscoveredUrl:
     title: str | None = None
     priority: int = 0  # Higher = more important
     metadata: dict[str, Any] = field(default_factory=dict)
+    _url_hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Intern the URL (discovery produces many shared prefixes) and
+        # hash it once; instances live in seen-sets and priority dicts.
+        self.url = sys.intern(self.url)
+        self._url_hash = hash(self.url)
 
     def __hash__(self) -> int:
-        return hash(self.url)
+        return self._url_hash
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, DiscoveredUrl):
@@ -53,7 +77,7 @@ class DiscoveredUrl:
         return self.url == other.url
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentPage:
     """A scraped documentation page."""
 
@@ -62,17 +86,22 @@ class DocumentPage:
     content_markdown: str
     content_html: str | None = None
     filepath: Path | None = None
-    scraped_at: datetime = field(default_factory=datetime.utcnow)
+    scraped_at: datetime = field(default_factory=_utcnow)
     word_count: int = 0
-    links: list[str] = field(default_factory=list)
+    links: set[str] = field(default_factory=set)
     metadata: dict[str, Any] = field(default_factory=dict)
+    content_hash: str = ""
 
     def __post_init__(self) -> None:
         if self.word_count == 0 and self.content_markdown:
             self.word_count = len(self.content_markdown.split())
+        if not self.content_hash and self.content_markdown:
+            self.content_hash = hashlib.blake2b(
+                self.content_markdown.encode(), digest_size=16
+            ).hexdigest()
 
 
-@dataclass
+@dataclass(slots=True)
 class CrawlResult:
     """Result of crawling a single URL."""
 
@@ -83,7 +112,147 @@ class CrawlResult:
     duration_ms: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
+class PageRecords:
+    """Columnar store for per-page manifest records.
+
+    One dict per page costs ~300 bytes of overhead and repeats every key
+    in the serialized manifest; parallel columns keep memory flat and
+    serialize each field name once. Iteration yields row dicts so cold
+    paths (index generation, resume) can stay row-oriented.
+    """
+
+    urls: list[str] = field(default_factory=list)
+    filepaths: list[str] = field(default_factory=list)
+    titles: list[str] = field(default_factory=list)
+    word_counts: list[int] = field(default_factory=list)
+    scraped_ats: list[str] = field(default_factory=list)
+    content_hashes: list[str] = field(default_factory=list)
+    simhashes: list[int] = field(default_factory=list)
+    etags: list[str] = field(default_factory=list)
+    last_modifieds: list[str] = field(default_factory=list)
+    _index: dict[str, int] = field(init=False, repr=False, compare=False, default_factory=dict)
+
+    def append(
+        self,
+        url: str,
+        filepath: str,
+        title: str,
+        word_count: int,
+        scraped_at: str,
+        content_hash: str = "",
+        simhash: int = 0,
+        etag: str = "",
+        last_modified: str = "",
+    ) -> None:
+        """Insert one page record, replacing any prior record for url.
+
+        Upsert semantics keep re-processing idempotent: a URL recorded
+        twice (e.g. a retry that eventually succeeds) overwrites its row
+        instead of appearing twice in the manifest.
+        """
+        row = self._index.get(url)
+        if row is not None:
+            self.filepaths[row] = filepath
+            self.titles[row] = title
+            self.word_counts[row] = word_count
+            self.scraped_ats[row] = scraped_at
+            self.content_hashes[row] = content_hash
+            self.simhashes[row] = simhash
+            self.etags[row] = etag
+            self.last_modifieds[row] = last_modified
+            return
+        self._index[url] = len(self.urls)
+        self.urls.append(url)
+        self.filepaths.append(filepath)
+        self.titles.append(title)
+        self.word_counts.append(word_count)
+        self.scraped_ats.append(scraped_at)
+        self.content_hashes.append(content_hash)
+        self.simhashes.append(simhash)
+        self.etags.append(etag)
+        self.last_modifieds.append(last_modified)
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    def __contains__(self, url: object) -> bool:
+        return url in self._index
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        columns = zip(
+            self.urls,
+            self.filepaths,
+            self.titles,
+            self.word_counts,
+            self.scraped_ats,
+            self.content_hashes,
+            self.simhashes,
+            self.etags,
+            self.last_modifieds,
+            strict=True,
+        )
+        for url, filepath, title, word_count, scraped_at, content_hash, simhash, etag, lm in columns:
+            yield {
+                "url": url,
+                "filepath": filepath,
+                "title": title,
+                "word_count": word_count,
+                "scraped_at": scraped_at,
+                "content_hash": content_hash,
+                "simhash": simhash,
+                "etag": etag,
+                "last_modified": lm,
+            }
+
+    def to_columns(self) -> dict[str, list[Any]]:
+        """Serialize as a column dict (each field name appears once)."""
+        return {
+            "url": self.urls,
+            "filepath": self.filepaths,
+            "title": self.titles,
+            "word_count": self.word_counts,
+            "scraped_at": self.scraped_ats,
+            "content_hash": self.content_hashes,
+            "simhash": self.simhashes,
+            "etag": self.etags,
+            "last_modified": self.last_modifieds,
+        }
+
+    @classmethod
+    def from_serialized(cls, data: dict[str, list[Any]] | list[dict[str, Any]]) -> "PageRecords":
+        """Load from columnar data, or from legacy row-dict manifests."""
+        records = cls()
+        if isinstance(data, list):
+            for row in data:
+                records.append(
+                    url=row["url"],
+                    filepath=row.get("filepath", ""),
+                    title=row.get("title", ""),
+                    word_count=row.get("word_count", 0),
+                    scraped_at=row.get("scraped_at", ""),
+                    content_hash=row.get("content_hash", ""),
+                    simhash=row.get("simhash", 0),
+                    etag=row.get("etag", ""),
+                    last_modified=row.get("last_modified", ""),
+                )
+        else:
+            records.urls = list(data.get("url", []))
+            records.filepaths = list(data.get("filepath", []))
+            records.titles = list(data.get("title", []))
+            records.word_counts = list(data.get("word_count", []))
+            records.scraped_ats = list(data.get("scraped_at", []))
+            records.content_hashes = list(data.get("content_hash", []))
+            # Manifests written before these columns existed pad with defaults
+            count = len(records.urls)
+            records.simhashes = list(data.get("simhash", [])) or [0] * count
+            records.etags = list(data.get("etag", [])) or [""] * count
+            records.last_modifieds = list(data.get("last_modified", [])) or [""] * count
+            records._index = {url: i for i, url in enumerate(records.urls)}
+        return records
+
+
+@dataclass(slots=True)
 class ScrapeManifest:
     """Manifest tracking the state of a scrape operation."""
 
@@ -96,7 +265,7 @@ class ScrapeManifest:
     successful: int = 0
     failed: int = 0
     skipped: int = 0
-    pages: list[dict[str, Any]] = field(default_factory=list)
+    pages: PageRecords = field(default_factory=PageRecords)
     failed_urls: list[dict[str, Any]] = field(default_factory=list)
 
     def to_dict(self) -> dict[str, Any]:
@@ -113,7 +282,7 @@ class ScrapeManifest:
                 "failed": self.failed,
                 "skipped": self.skipped,
             },
-            "pages": self.pages,
+            "pages": self.pages.to_columns(),
             "failed_urls": self.failed_urls,
         }
 
@@ -132,6 +301,6 @@ class ScrapeManifest:
             successful=data.get("stats", {}).get("successful", 0),
             failed=data.get("stats", {}).get("failed", 0),
             skipped=data.get("stats", {}).get("skipped", 0),
-            pages=data.get("pages", []),
+            pages=PageRecords.from_serialized(data.get("pages", [])),
             failed_urls=data.get("failed_urls", []),
         )
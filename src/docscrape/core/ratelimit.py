@@ -0,0 +1,45 @@
+"""Async rate limiting primitives."""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Token-bucket rate limiter shared across concurrent workers.
+
+    A per-request ``asyncio.sleep(delay)`` makes every worker pay the
+    full delay in its own task, serializing the crawl. A shared bucket
+    refills at ``rate`` tokens per second; acquiring a token is free
+    while the bucket has credit, so workers only wait when the global
+    budget is actually exhausted.
+    """
+
+    def __init__(self, rate: float, max_tokens: float | None = None) -> None:
+        """Initialize the bucket.
+
+        Args:
+            rate: Sustained tokens (requests) per second.
+            max_tokens: Burst capacity. Defaults to one second of rate.
+        """
+        self._rate = rate
+        self._max_tokens = max(1.0, max_tokens if max_tokens is not None else rate)
+        self._tokens = self._max_tokens
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._max_tokens,
+                    self._tokens + (now - self._updated) * self._rate,
+                )
+                self._updated = now
+
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
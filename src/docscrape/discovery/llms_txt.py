@@ -4,6 +4,8 @@ Many documentation sites provide an llms.txt file that lists all pages
 in a format optimized for LLM consumption. This strategy parses that file.
 """
 
+import contextlib
+import functools
 import re
 from collections.abc import AsyncIterator
 from urllib.parse import urljoin
@@ -14,16 +16,36 @@ from docscrape.core.interfaces import DiscoveryStrategy
 from docscrape.core.models import DiscoveredUrl, ScrapeConfig
 
 
+@functools.lru_cache(maxsize=4)
+def _url_pattern(base_url: str) -> re.Pattern[str]:
+    """Compile the fused URL-extraction pattern for a base URL.
+
+    Cached because the pattern is fixed per site but _extract_urls can
+    run more than once in a process (retries, multiple scrapes).
+    """
+    return re.compile(
+        rf"(?P<link>\[(?P<title>[^\]]+)\]\((?P<href>[^\)]+)\))"
+        rf"|(?P<abs>{re.escape(base_url)}[^\s\)\]>\"']+(?:\.md|\.html|/)?)"
+        rf"|(?P<md>https?://[^\s\)\]>\"']+\.md)"
+    )
+
+
 class LlmsTxtDiscovery(DiscoveryStrategy):
     """Discover URLs from an llms.txt file."""
 
-    def __init__(self, llms_txt_path: str = "/llms.txt") -> None:
+    def __init__(
+        self,
+        llms_txt_path: str = "/llms.txt",
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
         """Initialize the discovery strategy.
 
         Args:
             llms_txt_path: Path to the llms.txt file (relative to base URL).
+            client: Shared HTTP client to reuse pooled connections.
         """
         self._llms_txt_path = llms_txt_path
+        self.client = client
 
     @property
     def name(self) -> str:
@@ -38,12 +60,18 @@ class LlmsTxtDiscovery(DiscoveryStrategy):
         Yields:
             DiscoveredUrl objects for each found URL.
         """
+        self._compile_url_filters(config)
+
         llms_txt_url = urljoin(config.base_url.rstrip("/") + "/", self._llms_txt_path.lstrip("/"))
 
         if config.verbose:
             print(f"Fetching llms.txt from {llms_txt_url}...")
 
-        async with httpx.AsyncClient() as client:
+        async with contextlib.AsyncExitStack() as stack:
+            client = self.client
+            if client is None:
+                client = await stack.enter_async_context(httpx.AsyncClient())
+
             try:
                 response = await client.get(
                     llms_txt_url,
@@ -64,17 +92,8 @@ class LlmsTxtDiscovery(DiscoveryStrategy):
 
         for url_info in urls:
             # Apply include/exclude filters
-            if config.include_patterns and not any(
-                re.search(p, url_info.url) for p in config.include_patterns
-            ):
-                continue
-
-            if config.exclude_patterns and any(
-                re.search(p, url_info.url) for p in config.exclude_patterns
-            ):
-                continue
-
-            yield url_info
+            if self._url_passes_filters(url_info.url):
+                yield url_info
 
     def _extract_urls(self, content: str, base_url: str) -> list[DiscoveredUrl]:
         """Extract URLs from llms.txt content.
@@ -89,25 +108,25 @@ class LlmsTxtDiscovery(DiscoveryStrategy):
         urls: dict[str, DiscoveredUrl] = {}
         base_url = base_url.rstrip("/")
 
-        # Pattern for absolute URLs
-        abs_url_pattern = re.compile(rf'{re.escape(base_url)}[^\s\)\]>"\']+(?:\.md|\.html|/)?')
+        # One fused pattern walks the content a single time instead of a
+        # finditer pass per URL shape: markdown links [title](url), bare
+        # absolute URLs under the base, and bare .md URLs.
+        combined = _url_pattern(base_url)
 
-        # Pattern for markdown links: [title](url)
-        link_pattern = re.compile(r"\[([^\]]+)\]\(([^\)]+)\)")
+        for match in combined.finditer(content):
+            title: str | None = None
 
-        # Pattern for bare URLs ending in .md
-        md_pattern = re.compile(r'(https?://[^\s\)\]>"\']+\.md)')
+            if match.lastgroup in ("abs", "md"):
+                url = match.group(match.lastgroup)
+            else:
+                title = match.group("title").strip()
+                url = match.group("href").strip()
 
-        # Find all markdown links first (they have titles)
-        for match in link_pattern.finditer(content):
-            title = match.group(1).strip()
-            url = match.group(2).strip()
-
-            # Resolve relative URLs
-            if url.startswith("/"):
-                url = base_url + url
-            elif not url.startswith("http"):
-                url = urljoin(base_url + "/", url)
+                # Resolve relative URLs
+                if url.startswith("/"):
+                    url = base_url + url
+                elif not url.startswith("http"):
+                    url = urljoin(base_url + "/", url)
 
             # Clean up URL
             url = self._clean_url(url)
@@ -115,21 +134,9 @@ class LlmsTxtDiscovery(DiscoveryStrategy):
             if self._is_doc_url(url, base_url):
                 if url not in urls:
                     urls[url] = DiscoveredUrl(url=url, title=title)
-                elif urls[url].title is None:
+                elif title is not None and urls[url].title is None:
                     urls[url].title = title
 
-        # Find bare absolute URLs
-        for match in abs_url_pattern.finditer(content):
-            url = self._clean_url(match.group(0))
-            if self._is_doc_url(url, base_url) and url not in urls:
-                urls[url] = DiscoveredUrl(url=url)
-
-        # Find .md URLs
-        for match in md_pattern.finditer(content):
-            url = self._clean_url(match.group(1))
-            if self._is_doc_url(url, base_url) and url not in urls:
-                urls[url] = DiscoveredUrl(url=url)
-
         return list(urls.values())
 
     def _clean_url(self, url: str) -> str:
@@ -1,34 +1,123 @@
 """Discovery strategy using recursive link crawling."""
 
 import asyncio
+import contextlib
+import hashlib
+import math
+import pickle
 import re
-from collections import deque
 from collections.abc import AsyncIterator
+from pathlib import Path
 from urllib.parse import ParseResult, urljoin, urlparse
 
 import httpx
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
 from docscrape.core.interfaces import DiscoveryStrategy
 from docscrape.core.models import DiscoveredUrl, ScrapeConfig
+from docscrape.core.ratelimit import TokenBucket
+
+# Common non-doc paths, compiled once as a single union.
+_SKIP_RE = re.compile(
+    r"/api/|/assets/|/static/|/_next/|/images/|\.(png|jpg|gif|svg|css|js|woff|ttf)$",
+    re.IGNORECASE,
+)
+
+
+class _BloomFilter:
+    """Compact membership filter for visited-URL deduplication.
+
+    A plain ``set[str]`` holds every URL string seen, costing 100+ bytes
+    per entry on large crawls. A Bloom filter stores ~1.8 bytes per URL
+    at the default 0.1% false-positive rate; a false positive only means
+    one URL is wrongly treated as already visited, which is an acceptable
+    trade for discovery.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001) -> None:
+        bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._size = bits
+        self._num_hashes = max(1, round(bits / capacity * math.log(2)))
+        self._bits = bytearray((bits + 7) // 8)
+
+    def _indexes(self, item: str) -> list[int]:
+        # Double hashing: derive k indexes from one 128-bit digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little")
+        return [(h1 + i * h2) % self._size for i in range(self._num_hashes)]
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[i >> 3] & (1 << (i & 7)) for i in self._indexes(item))
+
+    def add(self, item: str) -> None:
+        for i in self._indexes(item):
+            self._bits[i >> 3] |= 1 << (i & 7)
+
+
+# Discovery state persisted for resume: the visited filter plus every
+# (url, title, priority) already emitted. The filter alone is not enough —
+# it suppresses re-fetching, so the emitted list is what lets a resumed
+# run hand the known URLs back to the crawler without re-walking links.
+_EmittedRow = tuple[str, str | None, int]
+
+
+def _dump_state(path: Path, visited: _BloomFilter, emitted: list[_EmittedRow]) -> None:
+    """Persist discovery state atomically (write to temp, then rename)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(pickle.dumps((visited, emitted)))
+    tmp.replace(path)
+
+
+def _load_state(path: Path) -> tuple[_BloomFilter, list[_EmittedRow]] | None:
+    """Load persisted discovery state, or None if missing or unusable.
+
+    A truncated or empty file (crash or full disk mid-write before dumps
+    became atomic) raises EOFError rather than UnpicklingError, and a
+    stale pickle can fail in arbitrary ways; any load error means "start
+    discovery from scratch" rather than crashing every later resume.
+    """
+    try:
+        loaded = pickle.loads(path.read_bytes())
+    except Exception:
+        return None
+    if isinstance(loaded, _BloomFilter):
+        # Filter-only format from before emitted URLs were persisted.
+        return loaded, []
+    if (
+        isinstance(loaded, tuple)
+        and len(loaded) == 2
+        and isinstance(loaded[0], _BloomFilter)
+        and isinstance(loaded[1], list)
+    ):
+        return loaded
+    return None
 
 
 class RecursiveCrawlDiscovery(DiscoveryStrategy):
     """Discover URLs by recursively crawling links."""
 
+    # Visited-filter persistence for resumed crawls
+    VISITED_FILENAME = "visited.bin"
+    VISITED_SAVE_INTERVAL = 500
+
     def __init__(
         self,
         max_depth: int = 5,
         content_selector: str | None = None,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize the discovery strategy.
 
         Args:
             max_depth: Maximum depth to crawl.
             content_selector: CSS selector for the content area to find links.
+            client: Shared HTTP client to reuse pooled connections.
         """
         self._max_depth = max_depth
         self._content_selector = content_selector
+        self.client = client
 
     @property
     def name(self) -> str:
@@ -37,6 +126,11 @@ class RecursiveCrawlDiscovery(DiscoveryStrategy):
     async def discover(self, config: ScrapeConfig) -> AsyncIterator[DiscoveredUrl]:
         """Discover URLs by crawling links recursively.
 
+        The crawl runs as a concurrent BFS: a pool of worker tasks pulls
+        (url, depth) pairs from a shared work queue, so network waits
+        overlap instead of serializing one request per round trip. The
+        pool size (``config.concurrency``) bounds in-flight requests.
+
         Args:
             config: Scrape configuration.
 
@@ -45,69 +139,129 @@ class RecursiveCrawlDiscovery(DiscoveryStrategy):
         """
         base_url = config.base_url.rstrip("/")
         parsed_base = urlparse(base_url)
+        self._compile_url_filters(config)
+
+        # Reload persisted state on resume so already-discovered pages
+        # are not re-fetched just to rediscover their links.
+        visited_path = config.output_dir / self.VISITED_FILENAME
+        visited: _BloomFilter | None = None
+        emitted: list[_EmittedRow] = []
+        if config.resume:
+            state = _load_state(visited_path)
+            if state is not None:
+                visited, emitted = state
+                if config.verbose:
+                    print(f"Resuming discovery with visited state from {visited_path}")
+        if visited is None:
+            visited = _BloomFilter()
+
+        # Re-emit everything the interrupted run already discovered; the
+        # crawler skips completed URLs itself, and the rest get fetched
+        # even though the visited filter stops re-walking their links.
+        for prev_url, prev_title, prev_priority in emitted:
+            yield DiscoveredUrl(url=prev_url, title=prev_title, priority=prev_priority)
+
+        # Shared rate budget: workers only wait when the global rate is
+        # exhausted, instead of each sleeping request_delay per fetch.
+        limiter = TokenBucket(rate=1.0 / config.request_delay) if config.request_delay > 0 else None
+
+        processed = 0
+        queue: asyncio.Queue[tuple[str, int]] = asyncio.Queue()
+        results: asyncio.Queue[DiscoveredUrl | None] = asyncio.Queue()
+        queue.put_nowait((base_url, 0))
 
-        visited: set[str] = set()
-        queue: deque[tuple[str, int]] = deque([(base_url, 0)])
+        async with contextlib.AsyncExitStack() as stack:
+            client = self.client
+            if client is None:
+                client = await stack.enter_async_context(httpx.AsyncClient())
 
-        async with httpx.AsyncClient() as client:
-            while queue:
-                url, depth = queue.popleft()
+            async def process(url: str, depth: int) -> None:
+                nonlocal processed
 
                 # Normalize URL
                 url = self._normalize_url(url)
 
                 if url in visited:
-                    continue
+                    return
 
                 if depth > self._max_depth:
-                    continue
+                    return
 
                 visited.add(url)
+                processed += 1
+                if processed % self.VISITED_SAVE_INTERVAL == 0:
+                    _dump_state(visited_path, visited, emitted)
 
                 # Apply filters
                 if not self._should_process(url, base_url, config):
-                    continue
+                    return
 
                 if config.verbose:
                     print(f"Discovering (depth={depth}): {url}")
 
+                if limiter is not None:
+                    await limiter.acquire()
+
+                # Stream so non-HTML responses (tarballs, PDFs linked
+                # from docs) are dropped after the headers, without
+                # downloading their bodies.
                 try:
-                    response = await client.get(
+                    async with client.stream(
+                        "GET",
                         url,
                         timeout=config.timeout,
                         follow_redirects=True,
-                    )
-
-                    if response.status_code != 200:
-                        continue
-
-                    content_type = response.headers.get("content-type", "")
-                    if "text/html" not in content_type:
-                        continue
+                    ) as response:
+                        if response.status_code != 200:
+                            return
 
-                    html = response.text
-                    title = self._extract_title(html)
-
-                    # Yield this URL
-                    yield DiscoveredUrl(
-                        url=url,
-                        title=title,
-                        priority=max(0, 100 - depth * 10),  # Higher priority for shallower pages
-                    )
-
-                    # Find links to add to queue
-                    if depth < self._max_depth:
-                        links = self._extract_links(html, url, parsed_base)
-                        for link in links:
-                            if link not in visited:
-                                queue.append((link, depth + 1))
-
-                    # Rate limiting
-                    await asyncio.sleep(config.request_delay)
+                        content_type = response.headers.get("content-type", "")
+                        if "text/html" not in content_type:
+                            return
 
+                        body = await response.aread()
                 except httpx.HTTPError as e:
                     if config.verbose:
                         print(f"Error fetching {url}: {e}")
+                    return
+
+                html = body.decode(response.encoding or "utf-8", errors="replace")
+                title, links = self._parse_page(html, url, parsed_base)
+
+                priority = max(0, 100 - depth * 10)  # Higher priority for shallower pages
+                await results.put(DiscoveredUrl(url=url, title=title, priority=priority))
+                emitted.append((url, title, priority))
+
+                # Find links to add to queue
+                if depth < self._max_depth:
+                    for link in links:
+                        if link not in visited:
+                            queue.put_nowait((link, depth + 1))
+
+            async def worker() -> None:
+                while True:
+                    url, depth = await queue.get()
+                    try:
+                        await process(url, depth)
+                    finally:
+                        queue.task_done()
+
+            async def close_when_drained() -> None:
+                await queue.join()
+                await results.put(None)
+
+            workers = [asyncio.create_task(worker()) for _ in range(config.concurrency)]
+            closer = asyncio.create_task(close_when_drained())
+
+            try:
+                while (discovered := await results.get()) is not None:
+                    yield discovered
+            finally:
+                closer.cancel()
+                for task in workers:
+                    task.cancel()
+                if processed:
+                    _dump_state(visited_path, visited, emitted)
 
     def _normalize_url(self, url: str) -> str:
         """Normalize a URL for deduplication."""
@@ -124,69 +278,65 @@ class RecursiveCrawlDiscovery(DiscoveryStrategy):
         if not url.startswith(base_url):
             return False
 
-        # Apply include filters
-        if config.include_patterns and not any(re.search(p, url) for p in config.include_patterns):
-            return False
-
-        # Apply exclude filters
-        if config.exclude_patterns and any(re.search(p, url) for p in config.exclude_patterns):
+        # Apply include/exclude filters
+        if not self._url_passes_filters(url):
             return False
 
         # Skip common non-doc paths
-        skip_patterns = [
-            r"/api/",
-            r"/assets/",
-            r"/static/",
-            r"/_next/",
-            r"/images/",
-            r"\.(png|jpg|gif|svg|css|js|woff|ttf)$",
-        ]
-        return all(not re.search(pattern, url, re.IGNORECASE) for pattern in skip_patterns)
-
-    def _extract_title(self, html: str) -> str | None:
-        """Extract the page title from HTML."""
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Try various title sources
-        if soup.title and soup.title.string:
-            return soup.title.string.strip()
+        return _SKIP_RE.search(url) is None
 
-        h1 = soup.find("h1")
-        if h1:
-            return h1.get_text(strip=True)
+    def _parse_page(
+        self, html: str, current_url: str, parsed_base: ParseResult
+    ) -> tuple[str | None, list[str]]:
+        """Extract the title and same-domain links from one parse.
 
-        return None
+        A single Lexbor (C engine) parse serves both lookups; this is the
+        CPU-bound part of discovery, so parsing once per page matters.
+        """
+        tree = LexborHTMLParser(html)
 
-    def _extract_links(self, html: str, current_url: str, parsed_base: ParseResult) -> list[str]:
-        """Extract links from HTML content."""
-        soup = BeautifulSoup(html, "html.parser")
+        # Try various title sources
+        title: str | None = None
+        title_node = tree.css_first("title")
+        if title_node is not None:
+            title = title_node.text(strip=True) or None
+        if title is None:
+            h1 = tree.css_first("h1")
+            if h1 is not None:
+                title = h1.text(strip=True) or None
 
         # If a content selector is specified, only look for links there
+        root = None
         if self._content_selector:
-            content = soup.select_one(self._content_selector)
-            if content:
-                soup = content
+            root = tree.css_first(self._content_selector)
+        if root is None:
+            root = tree.body or tree.root
 
         links: list[str] = []
 
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
+        if root is not None:
+            scheme_netloc = f"{parsed_base.scheme}://{parsed_base.netloc}"
+            base_prefix = scheme_netloc + "/"
+            for a in root.css("a[href]"):
+                href = a.attributes.get("href")
+                if not href:
+                    continue
 
-            # Skip javascript, mailto, tel links
-            if href.startswith(("javascript:", "mailto:", "tel:", "#")):
-                continue
+                # Skip javascript, mailto, tel links
+                if href.startswith(("javascript:", "mailto:", "tel:", "#")):
+                    continue
 
-            # Resolve relative URLs
-            if href.startswith("/"):
-                full_url = f"{parsed_base.scheme}://{parsed_base.netloc}{href}"
-            elif not href.startswith("http"):
-                full_url = urljoin(current_url, href)
-            else:
-                full_url = href
+                # Resolve relative URLs
+                if href.startswith("/") and not href.startswith("//"):
+                    full_url = scheme_netloc + href
+                elif not href.startswith("http"):
+                    full_url = urljoin(current_url, href)
+                else:
+                    full_url = href
 
-            # Only include URLs on the same domain
-            parsed_link = urlparse(full_url)
-            if parsed_link.netloc == parsed_base.netloc:
-                links.append(self._normalize_url(full_url))
+                # Only include URLs on the same domain; a prefix check
+                # avoids re-running urlparse on every anchor
+                if full_url.startswith(base_prefix) or full_url == scheme_netloc:
+                    links.append(self._normalize_url(full_url))
 
-        return links
+        return title, links
@@ -1,15 +1,17 @@
 """Discovery strategy using sitemap.xml files."""
 
+import asyncio
 import contextlib
-import re
-import xml.etree.ElementTree as ET
+import io
 from collections.abc import AsyncIterator
+from datetime import datetime, timezone
 from urllib.parse import urljoin
 
 import httpx
+from lxml import etree
 
 from docscrape.core.interfaces import DiscoveryStrategy
-from docscrape.core.models import DiscoveredUrl, ScrapeConfig
+from docscrape.core.models import DiscoveredUrl, ScrapeConfig, ScrapeManifest
 
 
 class SitemapDiscovery(DiscoveryStrategy):
@@ -18,14 +20,28 @@ class SitemapDiscovery(DiscoveryStrategy):
     # XML namespace for sitemaps
     SITEMAP_NS = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
 
-    def __init__(self, sitemap_paths: list[str] | None = None) -> None:
+    # Cap on concurrent child-sitemap fetches when walking a sitemap index
+    MAX_CONCURRENT_FETCHES = 10
+
+    def __init__(
+        self,
+        sitemap_paths: list[str] | None = None,
+        client: httpx.AsyncClient | None = None,
+        manifest: ScrapeManifest | None = None,
+    ) -> None:
         """Initialize the discovery strategy.
 
         Args:
             sitemap_paths: Paths to sitemap files (relative to base URL).
                           Defaults to ["/sitemap.xml", "/sitemap_index.xml"].
+            client: Shared HTTP client to reuse pooled connections.
+            manifest: Manifest from a previous run; URLs whose sitemap
+                     lastmod predates their scraped_at entry are skipped.
         """
         self._sitemap_paths = sitemap_paths or ["/sitemap.xml", "/sitemap_index.xml"]
+        self.client = client
+        self.manifest = manifest
+        self._last_scraped: dict[str, datetime] = {}
 
     @property
     def name(self) -> str:
@@ -41,8 +57,22 @@ class SitemapDiscovery(DiscoveryStrategy):
             DiscoveredUrl objects for each found URL.
         """
         base_url = config.base_url.rstrip("/")
+        self._compile_url_filters(config)
+
+        # Index previous-run scrape times so unchanged URLs (by lastmod)
+        # can be skipped without an HTTP round-trip.
+        self._last_scraped = {}
+        if self.manifest is not None:
+            pages = self.manifest.pages
+            for page_url, scraped_at in zip(pages.urls, pages.scraped_ats, strict=True):
+                with contextlib.suppress(ValueError):
+                    self._last_scraped[page_url] = datetime.fromisoformat(scraped_at)
+
+        async with contextlib.AsyncExitStack() as stack:
+            client = self.client
+            if client is None:
+                client = await stack.enter_async_context(httpx.AsyncClient())
 
-        async with httpx.AsyncClient() as client:
             # Try each sitemap path
             for path in self._sitemap_paths:
                 sitemap_url = urljoin(base_url + "/", path.lstrip("/"))
@@ -57,7 +87,7 @@ class SitemapDiscovery(DiscoveryStrategy):
                         follow_redirects=True,
                     )
                     if response.status_code == 200:
-                        urls = await self._parse_sitemap(client, response.text, base_url, config)
+                        urls = await self._parse_sitemap(client, response.content, base_url, config)
                         for url in urls:
                             yield url
                         return  # Found a working sitemap
@@ -68,95 +98,136 @@ class SitemapDiscovery(DiscoveryStrategy):
     async def _parse_sitemap(
         self,
         client: httpx.AsyncClient,
-        content: str,
+        content: bytes,
         base_url: str,
         config: ScrapeConfig,
     ) -> list[DiscoveredUrl]:
         """Parse a sitemap XML file.
 
+        Uses lxml's incremental iterparse so large sitemaps (tens of
+        megabytes, 50k entries) are walked by the C parser without ever
+        materializing a full DOM; each entry element is cleared as soon
+        as it has been read.
+
         Args:
             client: HTTP client for fetching nested sitemaps.
-            content: XML content.
+            content: Raw XML bytes.
             base_url: Base URL.
             config: Scrape configuration.
 
         Returns:
             List of discovered URLs.
         """
+        ns = self.SITEMAP_NS["sm"]
         urls: list[DiscoveredUrl] = []
+        child_sitemaps: list[str] = []
 
         try:
-            root = ET.fromstring(content)
-        except ET.ParseError as e:
+            for _event, elem in etree.iterparse(
+                io.BytesIO(content),
+                events=("end",),
+                tag=(f"{{{ns}}}url", f"{{{ns}}}sitemap"),
+            ):
+                loc = self._get_text(elem, "loc")
+
+                if elem.tag == f"{{{ns}}}sitemap":
+                    # Entry in a sitemap index pointing at a child sitemap
+                    if loc:
+                        child_sitemaps.append(loc.strip())
+                elif loc:
+                    url = loc.strip()
+
+                    # Filter by base URL
+                    if url.startswith(base_url) and self._url_passes_filters(url):
+                        lastmod = self._get_text(elem, "lastmod")
+
+                        # Skip URLs unchanged since the previous scrape
+                        if not self._is_modified(url, lastmod):
+                            elem.clear(keep_tail=True)
+                            continue
+
+                        # Extract priority if available
+                        priority = 0
+                        priority_text = self._get_text(elem, "priority")
+                        if priority_text:
+                            with contextlib.suppress(ValueError):
+                                priority = int(float(priority_text) * 100)
+
+                        urls.append(
+                            DiscoveredUrl(
+                                url=url,
+                                priority=priority,
+                                metadata={
+                                    "lastmod": lastmod,
+                                    "changefreq": self._get_text(elem, "changefreq"),
+                                },
+                            )
+                        )
+
+                # Release the parsed subtree so memory stays constant
+                elem.clear(keep_tail=True)
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        except etree.XMLSyntaxError as e:
             if config.verbose:
                 print(f"Failed to parse sitemap XML: {e}")
             return urls
 
-        # Check if this is a sitemap index
-        if root.tag.endswith("sitemapindex"):
-            # This is a sitemap index, fetch all child sitemaps
-            for sitemap in root.findall("sm:sitemap", self.SITEMAP_NS):
-                loc = sitemap.find("sm:loc", self.SITEMAP_NS)
-                if loc is not None and loc.text:
-                    try:
-                        response = await client.get(
-                            loc.text,
-                            timeout=config.timeout,
-                            follow_redirects=True,
-                        )
-                        if response.status_code == 200:
-                            child_urls = await self._parse_sitemap(
-                                client, response.text, base_url, config
-                            )
-                            urls.extend(child_urls)
-                    except httpx.HTTPError:
-                        pass
-        else:
-            # This is a regular sitemap
-            for url_elem in root.findall("sm:url", self.SITEMAP_NS):
-                loc = url_elem.find("sm:loc", self.SITEMAP_NS)
-                if loc is not None and loc.text:
-                    url = loc.text.strip()
+        if child_sitemaps:
+            # Fetch all child sitemaps concurrently; the index is pure wait
+            # time otherwise, so wall-clock collapses to the slowest child.
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
 
-                    # Filter by base URL
-                    if not url.startswith(base_url):
-                        continue
-
-                    # Apply include/exclude filters
-                    if config.include_patterns and not any(
-                        re.search(p, url) for p in config.include_patterns
-                    ):
-                        continue
-
-                    if config.exclude_patterns and any(
-                        re.search(p, url) for p in config.exclude_patterns
-                    ):
-                        continue
-
-                    # Extract priority if available
-                    priority_elem = url_elem.find("sm:priority", self.SITEMAP_NS)
-                    priority = 0
-                    if priority_elem is not None and priority_elem.text:
-                        with contextlib.suppress(ValueError):
-                            priority = int(float(priority_elem.text) * 100)
-
-                    urls.append(
-                        DiscoveredUrl(
-                            url=url,
-                            priority=priority,
-                            metadata={
-                                "lastmod": self._get_text(url_elem, "lastmod"),
-                                "changefreq": self._get_text(url_elem, "changefreq"),
-                            },
-                        )
+            async def fetch_child(sitemap_url: str) -> list[DiscoveredUrl]:
+                async with semaphore:
+                    response = await client.get(
+                        sitemap_url,
+                        timeout=config.timeout,
+                        follow_redirects=True,
                     )
+                if response.status_code != 200:
+                    return []
+                return await self._parse_sitemap(client, response.content, base_url, config)
+
+            children = await asyncio.gather(
+                *(fetch_child(loc) for loc in child_sitemaps),
+                return_exceptions=True,
+            )
+            for child in children:
+                if isinstance(child, list):
+                    urls.extend(child)
 
         if config.verbose:
             print(f"Found {len(urls)} URLs in sitemap")
 
         return urls
 
-    def _get_text(self, elem: ET.Element, tag: str) -> str | None:
+    def _is_modified(self, url: str, lastmod: str | None) -> bool:
+        """Check whether a URL changed since the manifest last saw it.
+
+        Returns True (crawl it) unless both a parseable lastmod and a
+        previous scraped_at exist and the scrape is the newer of the two.
+        """
+        if not lastmod or not self._last_scraped:
+            return True
+
+        scraped_at = self._last_scraped.get(url)
+        if scraped_at is None:
+            return True
+
+        try:
+            modified = datetime.fromisoformat(lastmod.strip().replace("Z", "+00:00"))
+        except ValueError:
+            return True
+
+        # Manifest timestamps are naive UTC; normalize for comparison
+        if modified.tzinfo is not None:
+            modified = modified.astimezone(timezone.utc).replace(tzinfo=None)
+        if scraped_at.tzinfo is not None:
+            scraped_at = scraped_at.astimezone(timezone.utc).replace(tzinfo=None)
+
+        return modified > scraped_at
+
+    def _get_text(self, elem: etree._Element, tag: str) -> str | None:
         """Get text from a child element."""
-        child = elem.find(f"sm:{tag}", self.SITEMAP_NS)
-        return child.text if child is not None else None
+        return elem.findtext(f"sm:{tag}", namespaces=self.SITEMAP_NS)
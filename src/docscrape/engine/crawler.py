@@ -1,13 +1,19 @@
-"""Documentation crawler using httpx and BeautifulSoup.
+"""Documentation crawler built on httpx.
 
 This module provides a lightweight crawler for documentation sites,
-using httpx for async HTTP requests and BeautifulSoup for HTML parsing.
+using httpx for async HTTP requests; HTML parsing happens in the
+platform adapters (selectolax/Lexbor, with a BeautifulSoup fallback).
 """
 
 import asyncio
+import contextlib
+import operator
+import random
 import time
 from collections.abc import AsyncIterator
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import httpx
 from rich.console import Console
@@ -20,6 +26,12 @@ from rich.progress import (
     TimeElapsedColumn,
 )
 
+try:  # Optional: aiohttp-backed transport behind the httpx API
+    from httpx_aiohttp import AiohttpTransport
+except ImportError:  # pragma: no cover - depends on installed extras
+    AiohttpTransport = None  # type: ignore[assignment, misc]
+
+from docscrape.core.dedup import SimHashIndex, simhash
 from docscrape.core.interfaces import PlatformAdapter, StorageBackend
 from docscrape.core.models import (
     CrawlResult,
@@ -29,10 +41,49 @@ from docscrape.core.models import (
     ScrapeManifest,
     ScrapeStatus,
 )
+from docscrape.core.ratelimit import TokenBucket
 
 console = Console()
 
 
+def _sort_urls(urls: list[DiscoveredUrl]) -> None:
+    """Sort in place: priority descending, URL ascending within ties.
+
+    Two stable attrgetter sorts stay on sorted()'s C fast path instead
+    of calling a tuple-building lambda once per element.
+    """
+    urls.sort(key=operator.attrgetter("url"))
+    urls.sort(key=operator.attrgetter("priority"), reverse=True)
+
+
+def _truncate_url(url: str, max_len: int = 50) -> str:
+    """Truncate a URL for display in the progress bar."""
+    if len(url) <= max_len:
+        return url
+    # Keep the last part of the URL (path)
+    return "..." + url[3 - max_len :]
+
+
+def _dedup_key(url: str) -> str:
+    """Normalize a URL into a deduplication key.
+
+    Alias URLs (trailing slash, fragments, tracking params, mixed-case
+    hosts) would otherwise each cost a full fetch; one hash-set lookup
+    on the normalized form replaces those redundant round trips.
+    """
+    parts = urlsplit(url)
+    query = urlencode(
+        [
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.startswith("utm_")
+        ]
+    )
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), query, "")
+    )
+
+
 class DocumentationCrawler:
     """Crawler for documentation websites."""
 
@@ -54,6 +105,44 @@ class DocumentationCrawler:
         self._config = config
         self._manifest: ScrapeManifest | None = None
         self._completed_urls: set[str] = set()
+        self._previous_hashes: dict[str, str] = {}
+        self._prior_headers: dict[str, tuple[str, str]] = {}
+        self._prior_entries: dict[str, dict[str, Any]] = {}
+        self._simhash_index = SimHashIndex()
+        self._client: httpx.AsyncClient | None = None
+        # Shared politeness budget: request_delay becomes a global rate
+        # (1/delay req/s) instead of a per-worker sleep.
+        self._limiter = (
+            TokenBucket(rate=1.0 / config.request_delay) if config.request_delay > 0 else None
+        )
+
+    async def _ensure_client(self) -> httpx.AsyncClient:
+        """Return the crawl-lifetime HTTP client, creating it on first use.
+
+        One pooled HTTP/2 client serves discovery, crawling, and every
+        retry, so warm requests reuse keepalive connections (and
+        multiplex on a single connection where the host speaks H2)
+        instead of paying a TCP+TLS handshake each time.
+
+        When the optional httpx-aiohttp extra is installed, requests run
+        on aiohttp's connection pool (markedly better tail latency at
+        high concurrency) while keeping the httpx API surface.
+        """
+        if self._client is None:
+            limits = httpx.Limits(
+                max_connections=max(100, self._config.concurrency * 2),
+                max_keepalive_connections=max(20, self._config.concurrency),
+            )
+            self._client = httpx.AsyncClient(
+                transport=AiohttpTransport(limits=limits) if AiohttpTransport else None,
+                http2=True,
+                limits=limits,
+                timeout=self._config.timeout,
+                follow_redirects=True,
+                # Ask for brotli explicitly; docs CDNs compress HTML ~5:1
+                headers={"accept-encoding": "gzip, br"},
+            )
+        return self._client
 
     async def crawl(self) -> ScrapeManifest:
         """Run the full crawl operation.
@@ -64,11 +153,16 @@ class DocumentationCrawler:
         # Initialize or load manifest
         await self._init_manifest()
 
-        # Use progress bar unless quiet mode
-        if self._config.quiet:
-            return await self._crawl_without_progress()
+        try:
+            # Use progress bar unless quiet mode
+            if self._config.quiet:
+                return await self._crawl_without_progress()
 
-        return await self._crawl_with_progress()
+            return await self._crawl_with_progress()
+        finally:
+            if self._client is not None:
+                await self._client.aclose()
+                self._client = None
 
     async def _crawl_without_progress(self) -> ScrapeManifest:
         """Run crawl without progress bar (quiet mode)."""
@@ -107,8 +201,8 @@ class DocumentationCrawler:
             await self._process_result(result)
 
         # Finalize manifest
-        self._manifest.completed_at = datetime.utcnow()  # type: ignore
-        await self._storage.save_manifest(self._manifest, self._config.output_dir)  # type: ignore
+        self._manifest.completed_at = datetime.now(timezone.utc)  # type: ignore
+        await self._storage.finalize(self._manifest, self._config.output_dir)  # type: ignore
 
         return self._manifest  # type: ignore
 
@@ -122,6 +216,8 @@ class DocumentationCrawler:
             TimeElapsedColumn(),
             console=console,
             transient=True,
+            # Cap redraw rate; per-URL draws contend with crawl tasks
+            refresh_per_second=8,
         ) as progress:
             # Discovery phase
             discovery_task = progress.add_task("[cyan]Discovering URLs...", total=None)
@@ -166,50 +262,108 @@ class DocumentationCrawler:
                 await self._process_result(result)
 
         # Finalize manifest
-        self._manifest.completed_at = datetime.utcnow()  # type: ignore
-        await self._storage.save_manifest(self._manifest, self._config.output_dir)  # type: ignore
+        self._manifest.completed_at = datetime.now(timezone.utc)  # type: ignore
+        await self._storage.finalize(self._manifest, self._config.output_dir)  # type: ignore
 
         return self._manifest  # type: ignore
 
     async def _init_manifest(self) -> None:
         """Initialize or load manifest."""
-        if self._config.resume:
-            existing = await self._storage.load_manifest(self._config.output_dir)
-            if existing:
-                self._manifest = existing
-                self._completed_urls = self._storage.get_completed_urls(existing)
-                if self._config.verbose:
-                    print(f"Resuming from existing manifest ({len(self._completed_urls)} pages)")
-                return
+        # Harvest state from any prior manifest even on fresh runs: the
+        # content hashes let unchanged pages skip their disk write, and
+        # the validators (ETag/Last-Modified) let re-crawls answer with
+        # 304s instead of full bodies.
+        existing = await self._storage.load_manifest(self._config.output_dir)
+        if existing:
+            self._previous_hashes = {
+                url: content_hash
+                for url, content_hash in zip(
+                    existing.pages.urls, existing.pages.content_hashes, strict=True
+                )
+                if content_hash
+            }
+            self._prior_headers = {
+                url: (etag, last_modified)
+                for url, etag, last_modified in zip(
+                    existing.pages.urls,
+                    existing.pages.etags,
+                    existing.pages.last_modifieds,
+                    strict=True,
+                )
+                if etag or last_modified
+            }
+            self._prior_entries = {row["url"]: row for row in existing.pages}
+
+        if self._config.resume and existing:
+            self._manifest = existing
+            self._completed_urls = self._storage.get_completed_urls(existing)
+            for page_simhash in existing.pages.simhashes:
+                if page_simhash:
+                    self._simhash_index.add(page_simhash)
+            if self._config.verbose:
+                print(f"Resuming from existing manifest ({len(self._completed_urls)} pages)")
+            return
+
+        if (
+            self._config.resume
+            and existing is None
+            and hasattr(self._storage, "recover_completed_urls")
+        ):
+            # No loadable manifest: rebuild resume state from the saved
+            # pages' frontmatter via a C-level directory walk.
+            self._completed_urls = await asyncio.to_thread(
+                self._storage.recover_completed_urls, self._config.output_dir
+            )
+            if self._completed_urls and self._config.verbose:
+                print(f"Recovered {len(self._completed_urls)} completed URLs from page files")
 
-        # Create new manifest
+        # Create new manifest; save it immediately so an interrupted run
+        # leaves a loadable header for the page log to resume against.
         self._manifest = ScrapeManifest(
             platform=self._config.platform,
             base_url=self._config.base_url,
             output_dir=str(self._config.output_dir),
-            started_at=datetime.utcnow(),
+            started_at=datetime.now(timezone.utc),
         )
+        await self._storage.save_manifest(self._manifest, self._config.output_dir)
 
     async def _discover_urls(self) -> list[DiscoveredUrl]:
-        """Discover URLs to crawl."""
+        """Discover URLs to crawl.
+
+        One pooled HTTP/2 client is shared across the primary and fallback
+        strategies so every fetch after the first reuses a keepalive
+        connection instead of paying a fresh TCP+TLS handshake.
+        """
         strategy = self._adapter.get_discovery_strategy()
 
         if self._config.verbose:
             print(f"Using discovery strategy: {strategy.name}")
 
         urls: list[DiscoveredUrl] = []
+        seen: set[str] = set()
+        client = await self._ensure_client()
+
+        strategy.client = client
+        if hasattr(strategy, "manifest"):
+            strategy.manifest = self._manifest
 
         async for url in strategy.discover(self._config):
             # Apply adapter-level skip logic
             if self._adapter.should_skip(url.url):
                 continue
 
+            # Drop alias URLs before they cost a fetch
+            key = _dedup_key(url.url)
+            if key in seen:
+                continue
+            seen.add(key)
+
             # Get priority from adapter
             url.priority = self._adapter.get_url_priority(url.url)
             urls.append(url)
 
         # Sort by priority (higher first)
-        urls.sort(key=lambda u: (-u.priority, u.url))
+        _sort_urls(urls)
 
         # If no URLs found, try fallback strategy
         if not urls and hasattr(self._adapter, "get_fallback_strategy"):
@@ -217,13 +371,21 @@ class DocumentationCrawler:
             if self._config.verbose:
                 print(f"Primary strategy found no URLs, trying fallback: {fallback.name}")
 
+            fallback.client = client
+            if hasattr(fallback, "manifest"):
+                fallback.manifest = self._manifest
+
             async for url in fallback.discover(self._config):
                 if self._adapter.should_skip(url.url):
                     continue
+                key = _dedup_key(url.url)
+                if key in seen:
+                    continue
+                seen.add(key)
                 url.priority = self._adapter.get_url_priority(url.url)
                 urls.append(url)
 
-            urls.sort(key=lambda u: (-u.priority, u.url))
+            _sort_urls(urls)
 
         return urls
 
@@ -244,104 +406,147 @@ class DocumentationCrawler:
             CrawlResult for each URL.
         """
         total = len(urls)
+        semaphore = asyncio.Semaphore(self._config.concurrency)
+        started = 0
+        client = await self._ensure_client()
 
-        async with httpx.AsyncClient(
-            timeout=self._config.timeout,
-            follow_redirects=True,
-        ) as client:
-            for i, discovered in enumerate(urls, 1):
-                url = discovered.url
-                start_time = time.time()
-
-                # Update progress bar with truncated URL
-                if progress is not None and task_id is not None:
-                    truncated_url = self._truncate_url(url, max_len=50)
-                    progress.update(
-                        task_id,
-                        description=f"[green]Crawling:[/green] {truncated_url}",
-                    )
+        async def crawl_one(discovered: DiscoveredUrl) -> CrawlResult:
+            nonlocal started
+            url = discovered.url
 
+            async with semaphore:
+                started += 1
                 if self._config.verbose:
-                    print(f"[{i}/{total}] Crawling: {url}")
+                    print(f"[{started}/{total}] Crawling: {url}")
 
+                start_time = time.time()
                 try:
                     page = await self._fetch_and_extract(client, url)
-                    duration = (time.time() - start_time) * 1000
-
-                    yield CrawlResult(
+                    result = CrawlResult(
                         url=url,
-                        status=ScrapeStatus.SUCCESS,
+                        # page is None when the server answered 304
+                        status=ScrapeStatus.SUCCESS if page is not None else ScrapeStatus.SKIPPED,
                         page=page,
-                        duration_ms=duration,
+                        duration_ms=(time.time() - start_time) * 1000,
                     )
-
                 except Exception as e:
-                    duration = (time.time() - start_time) * 1000
-                    error_msg = str(e)
-
                     if self._config.verbose:
-                        print(f"  -> FAILED: {error_msg}")
-
-                    yield CrawlResult(
+                        print(f"  -> FAILED: {e}")
+                    result = CrawlResult(
                         url=url,
                         status=ScrapeStatus.FAILED,
-                        error=error_msg,
-                        duration_ms=duration,
+                        error=str(e),
+                        duration_ms=(time.time() - start_time) * 1000,
                     )
 
-                # Advance progress bar
+            return result
+
+        # Fan out up to `concurrency` in-flight fetches; results are
+        # yielded in completion order, not submission order.
+        tasks = [asyncio.create_task(crawl_one(d)) for d in urls]
+        last_description = 0.0
+
+        try:
+            for coro in asyncio.as_completed(tasks):
+                result = await coro
+
                 if progress is not None and task_id is not None:
+                    # Advance every result (cheap counter bump; Rich
+                    # coalesces draws), but rebuild the description
+                    # string at most a few times per second.
+                    now = time.monotonic()
+                    if now - last_description >= 0.25:
+                        last_description = now
+                        truncated_url = _truncate_url(result.url, max_len=50)
+                        progress.update(
+                            task_id,
+                            description=f"[green]Crawling:[/green] {truncated_url}",
+                        )
                     progress.advance(task_id)
 
-                # Rate limiting
-                await asyncio.sleep(self._config.request_delay)
+                yield result
+        finally:
+            for task in tasks:
+                task.cancel()
 
-    def _truncate_url(self, url: str, max_len: int = 50) -> str:
-        """Truncate URL for display in progress bar."""
-        if len(url) <= max_len:
-            return url
-        # Keep the last part of the URL (path)
-        return "..." + url[-(max_len - 3) :]
-
-    async def _fetch_and_extract(self, client: httpx.AsyncClient, url: str) -> DocumentPage:
+    async def _fetch_and_extract(self, client: httpx.AsyncClient, url: str) -> DocumentPage | None:
         """Fetch a URL and extract content.
 
+        Sends the validators recorded on a previous crawl
+        (If-None-Match / If-Modified-Since) so unchanged pages answer
+        with a header-only 304 instead of a full body.
+
         Args:
             client: HTTP client.
             url: URL to fetch.
 
         Returns:
-            Extracted DocumentPage.
+            Extracted DocumentPage, or None if the server reported the
+            page unmodified (304) since the prior crawl.
         """
+        conditional: dict[str, str] = {}
+        prior = self._prior_headers.get(url)
+        if prior is not None:
+            etag, last_modified = prior
+            if etag:
+                conditional["if-none-match"] = etag
+            if last_modified:
+                conditional["if-modified-since"] = last_modified
+
         # Retry logic
         last_error: Exception | None = None
 
         for attempt in range(self._config.max_retries):
             try:
-                response = await client.get(url)
-                response.raise_for_status()
-
-                html = response.text
-                page = self._adapter.extract_content(html, url)
-
-                # Set filepath
+                if self._limiter is not None:
+                    await self._limiter.acquire()
+                # Stream + aread keeps one bytes buffer instead of the
+                # extra copies response.text's charset detection makes.
+                async with client.stream("GET", url, headers=conditional or None) as response:
+                    if response.status_code == 304:
+                        return None
+                    response.raise_for_status()
+                    body = await response.aread()
+
+                html = body.decode(response.encoding or "utf-8", errors="replace")
+                page = await self._adapter.extract_content_async(html, url)
+
+                # Set filepath and remember the validators for next crawl
                 page.filepath = self._adapter.url_to_filepath(url, self._config.output_dir)
+                page.metadata["etag"] = response.headers.get("etag", "")
+                page.metadata["last_modified"] = response.headers.get("last-modified", "")
 
                 return page
 
             except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    raise  # Don't retry 404s
+                if e.response.status_code not in (429, 502, 503, 504):
+                    raise  # 404s and other client errors won't improve on retry
                 last_error = e
 
             except httpx.RequestError as e:
                 last_error = e
 
             if attempt < self._config.max_retries - 1:
-                await asyncio.sleep(self._config.request_delay * (attempt + 1))
+                await asyncio.sleep(self._compute_backoff(attempt, last_error))
 
         raise last_error or Exception("Unknown error during fetch")
 
+    def _compute_backoff(self, attempt: int, error: Exception | None) -> float:
+        """Pick the delay before the next retry attempt.
+
+        Honors the server's Retry-After when present; otherwise uses
+        capped exponential backoff with jitter so workers that failed
+        together don't all retry in the same instant.
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            retry_after = error.response.headers.get("retry-after")
+            if retry_after is not None:
+                with contextlib.suppress(ValueError):
+                    return float(retry_after)
+
+        base = self._config.request_delay or 1.0
+        return min(30.0, base * 2**attempt) * random.uniform(0.5, 1.5)
+
     async def _process_result(self, result: CrawlResult) -> None:
         """Process a crawl result.
 
@@ -349,24 +554,61 @@ class DocumentationCrawler:
             result: Result to process.
         """
         if result.status == ScrapeStatus.SUCCESS and result.page:
-            # Save the page
-            await self._storage.save_page(result.page, result.page.filepath)  # type: ignore
-
-            # Update manifest
-            self._manifest.successful += 1  # type: ignore
-            self._manifest.pages.append(  # type: ignore
-                {
-                    "url": result.url,
-                    "filepath": str(result.page.filepath),
-                    "title": result.page.title,
-                    "word_count": result.page.word_count,
-                    "scraped_at": result.page.scraped_at.isoformat(),
-                }
+            # Drop near-duplicates (version aliases, anchors promoted to
+            # pages): the first copy wins, later ones within Hamming
+            # distance 3 of it are not written or recorded.
+            page_simhash = simhash(result.page.content_markdown.split())
+            if self._simhash_index.find_near(page_simhash) is not None:
+                self._manifest.skipped += 1  # type: ignore
+                if self._config.verbose:
+                    print(f"  -> Skipped near-duplicate: {result.url}")
+                return
+            self._simhash_index.add(page_simhash)
+
+            # Skip the write when the rendered markdown is byte-identical
+            # to what a previous run already stored.
+            unchanged = (
+                self._previous_hashes.get(result.url) == result.page.content_hash
+                and result.page.filepath is not None
+                and result.page.filepath.exists()
             )
+            if not unchanged:
+                await self._storage.save_page(result.page, result.page.filepath)  # type: ignore
+
+            # Update manifest and the O(1) incremental page log
+            entry = {
+                "url": result.url,
+                "filepath": str(result.page.filepath),
+                "title": result.page.title,
+                "word_count": result.page.word_count,
+                "scraped_at": result.page.scraped_at.isoformat(),
+                "content_hash": result.page.content_hash,
+                "simhash": page_simhash,
+                "etag": result.page.metadata.get("etag", ""),
+                "last_modified": result.page.metadata.get("last_modified", ""),
+            }
+            if result.url not in self._manifest.pages:  # type: ignore
+                self._manifest.successful += 1  # type: ignore
+            self._manifest.pages.append(**entry)  # type: ignore
+            await self._storage.append_page(entry, self._config.output_dir)
 
             if self._config.verbose:
                 print(f"  -> Saved: {result.page.filepath}")
 
+        elif result.status == ScrapeStatus.SKIPPED:
+            # 304 Not Modified: carry the prior crawl's record forward
+            # untouched; the stored markdown on disk is still current.
+            entry = self._prior_entries.get(result.url)
+            if entry is not None:
+                if entry.get("simhash"):
+                    self._simhash_index.add(entry["simhash"])
+                if result.url not in self._manifest.pages:  # type: ignore
+                    self._manifest.successful += 1  # type: ignore
+                self._manifest.pages.append(**entry)  # type: ignore
+                await self._storage.append_page(entry, self._config.output_dir)
+            if self._config.verbose:
+                print(f"  -> Not modified: {result.url}")
+
         else:
             self._manifest.failed += 1  # type: ignore
             self._manifest.failed_urls.append(  # type: ignore
@@ -375,10 +617,3 @@ class DocumentationCrawler:
                     "error": result.error,
                 }
             )
-
-        # Periodically save manifest for resume support
-        if (self._manifest.successful + self._manifest.failed) % 10 == 0:  # type: ignore
-            await self._storage.save_manifest(
-                self._manifest,
-                self._config.output_dir,  # type: ignore
-            )
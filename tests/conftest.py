@@ -1,8 +1,49 @@
 """Pytest configuration and fixtures."""
 
-import pytest
-from pathlib import Path
 import tempfile
+from pathlib import Path
+
+import pytest
+
+from docscrape.adapters.factory import PlatformAdapterFactory
+from docscrape.adapters.generic import GenericAdapter
+from docscrape.adapters.livekit import LiveKitAdapter
+from docscrape.adapters.pipecat import PipecatAdapter
+from docscrape.adapters.retellai import RetellAIAdapter
+
+
+@pytest.fixture(scope="session")
+def adapter_factory():
+    """Shared factory class; get_adapter caches instances internally.
+
+    Tests that mutate the registry via register_platform should call
+    it on their own and clean up, not through this fixture.
+    """
+    return PlatformAdapterFactory
+
+
+@pytest.fixture(scope="module")
+def generic_adapter():
+    """Shared GenericAdapter; its URL predicates are pure."""
+    return GenericAdapter(base_url="https://example.com")
+
+
+@pytest.fixture(scope="module")
+def livekit_adapter():
+    """Shared LiveKitAdapter; its URL predicates are pure."""
+    return LiveKitAdapter()
+
+
+@pytest.fixture(scope="module")
+def pipecat_adapter():
+    """Shared PipecatAdapter; its URL predicates are pure."""
+    return PipecatAdapter()
+
+
+@pytest.fixture(scope="module")
+def retellai_adapter():
+    """Shared RetellAIAdapter; its URL predicates are pure."""
+    return RetellAIAdapter()
 
 
 @pytest.fixture
@@ -12,9 +53,9 @@ def temp_dir():
         yield Path(tmpdir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_html():
-    """Sample HTML content for testing."""
+    """Sample HTML content for testing (immutable, built once)."""
     return """
     <!DOCTYPE html>
     <html>
@@ -4,7 +4,6 @@ from pathlib import Path
 
 import pytest
 
-from docscrape.adapters.factory import PlatformAdapterFactory
 from docscrape.adapters.generic import GenericAdapter
 from docscrape.adapters.livekit import LiveKitAdapter
 from docscrape.adapters.pipecat import PipecatAdapter
@@ -14,55 +13,61 @@ from docscrape.adapters.retellai import RetellAIAdapter
 class TestPlatformAdapterFactory:
     """Tests for the PlatformAdapterFactory."""
 
-    def test_get_adapter_by_platform_livekit(self):
-        """Test getting LiveKit adapter by platform name."""
-        adapter = PlatformAdapterFactory.get_adapter(platform="livekit")
-        assert isinstance(adapter, LiveKitAdapter)
-        assert adapter.name == "livekit"
-
-    def test_get_adapter_by_platform_pipecat(self):
-        """Test getting Pipecat adapter by platform name."""
-        adapter = PlatformAdapterFactory.get_adapter(platform="pipecat")
-        assert isinstance(adapter, PipecatAdapter)
-        assert adapter.name == "pipecat"
-
-    def test_get_adapter_by_platform_retellai(self):
-        """Test getting RetellAI adapter by platform name."""
-        adapter = PlatformAdapterFactory.get_adapter(platform="retellai")
-        assert isinstance(adapter, RetellAIAdapter)
-        assert adapter.name == "retellai"
-
-    def test_get_adapter_by_url_autodetect(self):
+    @pytest.mark.parametrize(
+        "platform,expected_cls",
+        [
+            pytest.param("livekit", LiveKitAdapter, id="livekit"),
+            pytest.param("pipecat", PipecatAdapter, id="pipecat"),
+            pytest.param("retellai", RetellAIAdapter, id="retellai"),
+        ],
+    )
+    def test_get_adapter_by_platform(self, adapter_factory, platform, expected_cls):
+        """Test getting each adapter by platform name."""
+        adapter = adapter_factory.get_adapter(platform=platform)
+        assert isinstance(adapter, expected_cls)
+        assert adapter.name == platform
+
+    def test_get_adapter_by_url_autodetect(self, adapter_factory):
         """Test auto-detecting adapter from URL."""
-        adapter = PlatformAdapterFactory.get_adapter(url="https://docs.livekit.io/agents")
+        adapter = adapter_factory.get_adapter(url="https://docs.livekit.io/agents")
         assert isinstance(adapter, LiveKitAdapter)
 
-    def test_get_adapter_by_url_generic_fallback(self):
+    def test_get_adapter_by_url_generic_fallback(self, adapter_factory):
         """Test falling back to generic adapter for unknown URLs."""
-        adapter = PlatformAdapterFactory.get_adapter(url="https://example.com/docs")
+        adapter = adapter_factory.get_adapter(url="https://example.com/docs")
         assert isinstance(adapter, GenericAdapter)
         assert adapter.base_url == "https://example.com/docs"
 
-    def test_get_adapter_raises_without_args(self):
+    def test_get_adapter_raises_without_args(self, adapter_factory):
         """Test that get_adapter raises without platform or url."""
         with pytest.raises(ValueError, match="Either platform or url must be provided"):
-            PlatformAdapterFactory.get_adapter()
+            adapter_factory.get_adapter()
 
-    def test_list_platforms(self):
+    def test_list_platforms(self, adapter_factory):
         """Test listing available platforms."""
-        platforms = PlatformAdapterFactory.list_platforms()
+        platforms = adapter_factory.list_platforms()
         assert "livekit" in platforms
         assert "pipecat" in platforms
         assert "retellai" in platforms
+        # Pin the memoization: repeat calls return the cached list until
+        # register_platform invalidates it.
+        assert adapter_factory.list_platforms() is platforms
+
+
+@pytest.fixture(scope="module")
+def extracted_page(generic_adapter, sample_html):
+    """Extract the sample page once; the assertions only read from it."""
+    return generic_adapter.extract_content(sample_html, "https://example.com/page")
 
 
 class TestGenericAdapter:
     """Tests for the GenericAdapter."""
 
-    def test_extract_content(self, sample_html):
+    OUTPUT_DIR = Path("/output")
+
+    def test_extract_content(self, extracted_page):
         """Test extracting content from HTML."""
-        adapter = GenericAdapter(base_url="https://example.com")
-        page = adapter.extract_content(sample_html, "https://example.com/page")
+        page = extracted_page
 
         assert page.title == "Test Page"
         assert "Test Page Title" in page.content_markdown
@@ -70,76 +75,99 @@ class TestGenericAdapter:
         assert "Navigation" not in page.content_markdown  # nav should be removed
         assert "Footer" not in page.content_markdown  # footer should be removed
 
-    def test_url_to_filepath(self):
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            pytest.param("https://example.com/docs/page", "docs/page.md", id="regular-path"),
+            pytest.param("https://example.com/", "index.md", id="root-path"),
+            pytest.param("https://example.com/docs/page.html", "docs/page.md", id="html-ext"),
+        ],
+    )
+    def test_url_to_filepath(self, generic_adapter, url, expected):
         """Test URL to filepath conversion."""
-        adapter = GenericAdapter(base_url="https://example.com")
-        output_dir = Path("/output")
-
-        # Regular path
-        result = adapter.url_to_filepath("https://example.com/docs/page", output_dir)
-        assert result == Path("/output/docs/page.md")
-
-        # Root path
-        result = adapter.url_to_filepath("https://example.com/", output_dir)
-        assert result == Path("/output/index.md")
-
-        # Path with .html extension
-        result = adapter.url_to_filepath("https://example.com/docs/page.html", output_dir)
-        assert result == Path("/output/docs/page.md")
+        result = generic_adapter.url_to_filepath(url, self.OUTPUT_DIR)
+        assert result == self.OUTPUT_DIR / expected
 
 
 class TestLiveKitAdapter:
     """Tests for the LiveKitAdapter."""
 
-    def test_should_skip_api_reference(self):
-        """Test that API reference pages are skipped."""
-        adapter = LiveKitAdapter()
-        assert adapter.should_skip("https://docs.livekit.io/api-reference/foo")
-        assert not adapter.should_skip("https://docs.livekit.io/agents/overview")
-
-    def test_should_skip_changelog(self):
-        """Test that changelog pages are skipped."""
-        adapter = LiveKitAdapter()
-        assert adapter.should_skip("https://docs.livekit.io/changelog")
-
-    def test_url_priority_agents(self):
-        """Test URL priority for agents pages."""
-        adapter = LiveKitAdapter()
-        assert adapter.get_url_priority("https://docs.livekit.io/agents/overview") == 100
-
-    def test_url_priority_guides(self):
-        """Test URL priority for guides pages."""
-        adapter = LiveKitAdapter()
-        assert adapter.get_url_priority("https://docs.livekit.io/guides/foo") == 80
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            pytest.param("https://docs.livekit.io/api-reference/foo", True, id="api-reference"),
+            pytest.param("https://docs.livekit.io/agents/overview", False, id="agents"),
+            pytest.param("https://docs.livekit.io/changelog", True, id="changelog"),
+            pytest.param("https://docs.livekit.io/changelog/v1", True, id="changelog-subpath"),
+            pytest.param("https://docs.livekit.io/reference/apis", False, id="reference-apis"),
+        ],
+    )
+    def test_should_skip(self, livekit_adapter, url, expected):
+        """Test the skip predicate across URL patterns."""
+        assert livekit_adapter.should_skip(url) is expected
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            pytest.param("https://docs.livekit.io/agents/overview", 100, id="agents"),
+            pytest.param("https://docs.livekit.io/guides/foo", 80, id="guides"),
+            # Overlapping rules: the first table entry wins, not the
+            # leftmost match in the URL.
+            pytest.param("https://docs.livekit.io/guides/agents/foo", 100, id="table-order"),
+        ],
+    )
+    def test_url_priority(self, livekit_adapter, url, expected):
+        """Test URL priorities across URL patterns."""
+        assert livekit_adapter.get_url_priority(url) == expected
 
 
 class TestPipecatAdapter:
     """Tests for the PipecatAdapter."""
 
-    def test_should_skip_api(self):
-        """Test that API pages are skipped (except overview)."""
-        adapter = PipecatAdapter()
-        assert adapter.should_skip("https://docs.pipecat.ai/api/reference")
-        assert not adapter.should_skip("https://docs.pipecat.ai/api/overview")
-
-    def test_url_priority_quickstart(self):
-        """Test URL priority for quickstart pages."""
-        adapter = PipecatAdapter()
-        assert adapter.get_url_priority("https://docs.pipecat.ai/quickstart") == 100
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            pytest.param("https://docs.pipecat.ai/api/reference", True, id="api"),
+            pytest.param("https://docs.pipecat.ai/api/overview", False, id="api-overview"),
+        ],
+    )
+    def test_should_skip(self, pipecat_adapter, url, expected):
+        """Test the skip predicate across URL patterns."""
+        assert pipecat_adapter.should_skip(url) is expected
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            pytest.param("https://docs.pipecat.ai/quickstart", 100, id="quickstart"),
+            # Overlapping rules: the first table entry wins, not the
+            # leftmost match in the URL.
+            pytest.param("https://docs.pipecat.ai/examples/quickstart", 100, id="table-order"),
+        ],
+    )
+    def test_url_priority(self, pipecat_adapter, url, expected):
+        """Test URL priorities across URL patterns."""
+        assert pipecat_adapter.get_url_priority(url) == expected
 
 
 class TestRetellAIAdapter:
     """Tests for the RetellAIAdapter."""
 
-    def test_should_skip_api_reference(self):
-        """Test that API reference pages are skipped."""
-        adapter = RetellAIAdapter()
-        assert adapter.should_skip("https://docs.retellai.com/api-reference/foo")
-
-    def test_url_priority_conversation_flow(self):
-        """Test URL priority for conversation flow pages."""
-        adapter = RetellAIAdapter()
-        priority = adapter.get_url_priority(
-            "https://docs.retellai.com/conversation-flow/guide"
-        )
-        assert priority == 100
+    @pytest.mark.parametrize(
+        "url,expected",
+        [pytest.param("https://docs.retellai.com/api-reference/foo", True, id="api-reference")],
+    )
+    def test_should_skip(self, retellai_adapter, url, expected):
+        """Test the skip predicate across URL patterns."""
+        assert retellai_adapter.should_skip(url) is expected
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            pytest.param(
+                "https://docs.retellai.com/conversation-flow/guide", 100, id="conversation-flow"
+            )
+        ],
+    )
+    def test_url_priority(self, retellai_adapter, url, expected):
+        """Test URL priorities across URL patterns."""
+        assert retellai_adapter.get_url_priority(url) == expected
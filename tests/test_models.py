@@ -3,6 +3,8 @@
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 from docscrape.core.models import (
     DiscoveredUrl,
     DocumentPage,
@@ -55,6 +57,12 @@ class TestDiscoveredUrl:
         }
         assert len(urls) == 2
 
+    def test_slots_layout(self):
+        """Test that instances stay on the compact slots layout."""
+        url = DiscoveredUrl(url="https://example.com/a")
+        assert not hasattr(url, "__dict__")
+        assert DiscoveredUrl.__hash__ is not None
+
 
 class TestDocumentPage:
     """Tests for DocumentPage."""
@@ -79,62 +87,49 @@ class TestDocumentPage:
         assert page.word_count == 100
 
 
+@pytest.fixture(scope="module")
+def manifest_pair():
+    """A manifest and its serialized dict, built once per module.
+
+    Safe to share: the tests below only read from both halves.
+    """
+    original = ScrapeManifest(
+        platform="test",
+        base_url="https://example.com",
+        output_dir="./output",
+        started_at=datetime(2024, 1, 1, 12, 0, 0),
+        completed_at=datetime(2024, 1, 1, 13, 0, 0),
+        total_urls=15,
+        successful=10,
+        failed=5,
+    )
+    return original, original.to_dict()
+
+
 class TestScrapeManifest:
     """Tests for ScrapeManifest."""
 
-    def test_to_dict(self):
+    def test_to_dict(self, manifest_pair):
         """Test converting manifest to dictionary."""
-        manifest = ScrapeManifest(
-            platform="test",
-            base_url="https://example.com",
-            output_dir="./output",
-            started_at=datetime(2024, 1, 1, 12, 0, 0),
-            successful=10,
-            failed=2,
-        )
-        data = manifest.to_dict()
+        _, data = manifest_pair
 
         assert data["platform"] == "test"
         assert data["base_url"] == "https://example.com"
         assert data["stats"]["successful"] == 10
-        assert data["stats"]["failed"] == 2
+        assert data["stats"]["failed"] == 5
 
-    def test_from_dict(self):
+    def test_from_dict(self, manifest_pair):
         """Test creating manifest from dictionary."""
-        data = {
-            "platform": "test",
-            "base_url": "https://example.com",
-            "output_dir": "./output",
-            "started_at": "2024-01-01T12:00:00",
-            "completed_at": None,
-            "stats": {
-                "total_urls": 12,
-                "successful": 10,
-                "failed": 2,
-                "skipped": 0,
-            },
-            "pages": [],
-            "failed_urls": [],
-        }
+        _, data = manifest_pair
         manifest = ScrapeManifest.from_dict(data)
 
         assert manifest.platform == "test"
         assert manifest.successful == 10
-        assert manifest.failed == 2
+        assert manifest.failed == 5
 
-    def test_roundtrip(self):
+    def test_roundtrip(self, manifest_pair):
         """Test that to_dict and from_dict are inverses."""
-        original = ScrapeManifest(
-            platform="test",
-            base_url="https://example.com",
-            output_dir="./output",
-            started_at=datetime(2024, 1, 1, 12, 0, 0),
-            completed_at=datetime(2024, 1, 1, 13, 0, 0),
-            total_urls=15,
-            successful=10,
-            failed=5,
-        )
-        data = original.to_dict()
+        original, data = manifest_pair
         restored = ScrapeManifest.from_dict(data)
 
         assert restored.platform == original.platform
@@ -146,10 +141,17 @@ class TestScrapeManifest:
 class TestScrapeStatus:
     """Tests for ScrapeStatus enum."""
 
-    def test_status_values(self):
-        """Test status enum values."""
-        assert ScrapeStatus.PENDING.value == "pending"
-        assert ScrapeStatus.IN_PROGRESS.value == "in_progress"
-        assert ScrapeStatus.SUCCESS.value == "success"
-        assert ScrapeStatus.FAILED.value == "failed"
-        assert ScrapeStatus.SKIPPED.value == "skipped"
+    @pytest.mark.parametrize(
+        "member,value",
+        [
+            pytest.param(ScrapeStatus.PENDING, "pending", id="pending"),
+            pytest.param(ScrapeStatus.IN_PROGRESS, "in_progress", id="in-progress"),
+            pytest.param(ScrapeStatus.SUCCESS, "success", id="success"),
+            pytest.param(ScrapeStatus.FAILED, "failed", id="failed"),
+            pytest.param(ScrapeStatus.SKIPPED, "skipped", id="skipped"),
+        ],
+    )
+    def test_status_values(self, member, value):
+        """Test status enum values and lookup roundtrip."""
+        assert member.value == value
+        assert ScrapeStatus(value) is member